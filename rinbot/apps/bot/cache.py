@@ -0,0 +1,86 @@
+import os
+import marshal
+import hashlib
+
+from typing import Any, Iterable, Optional
+
+
+def content_hash(paths: Iterable[str]) -> str:
+    """
+    Returns a SHA-256 digest over the names and contents of a list of files
+    """
+
+    digest = hashlib.sha256()
+
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(os.path.basename(path).encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(f.read())
+            digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def _header(digest: str) -> bytes:
+    return digest.encode("ascii") + b"\n"
+
+
+def read_cache(path: str, digest: str) -> Optional[Any]:
+    """
+    Loads a binary cache file if it was written for the given content digest
+
+    The digest is stored as a header line and compared before the body is decoded.
+    The body is marshal data, which only holds plain values and never runs code
+    (unlike pickle), so a tampered file can't do more than fail to load
+
+    Args:
+        path (str): The cache file, usually under Path.CACHE
+        digest (str): The content hash of the source files
+
+    Returns:
+        Optional[Any]: The cached data, or None if missing, stale or unreadable
+    """
+
+    try:
+        with open(path, "rb") as f:
+            if f.readline() != _header(digest):
+                return None
+
+            return marshal.loads(f.read())
+
+    except Exception:
+        return None
+
+
+def write_cache(path: str, digest: str, data: Any) -> bool:
+    """
+    Atomically writes data to a binary cache file tagged with a content digest
+
+    Data must be made of the types marshal supports (dicts, lists, tuples, strings,
+    numbers, booleans and None), anything else isn't cached
+
+    Returns:
+        bool: True if the cache was written
+    """
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(tmp_path, "wb") as f:
+            f.write(_header(digest))
+            f.write(marshal.dumps(data))
+
+        os.replace(tmp_path, path)
+
+        return True
+
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+        return False
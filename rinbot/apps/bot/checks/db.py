@@ -1,17 +1,25 @@
+import time
 import asyncio
+import hashlib
 
+from collections import defaultdict
+from datetime import timedelta
+from graphlib import TopologicalSorter
 from inspect import getmembers, ismethod
-from typing import TYPE_CHECKING
-from django.db.models import Q
-from discord import TextChannel, CategoryChannel, ForumChannel
+from typing import TYPE_CHECKING, Optional, Callable, Awaitable, AsyncIterator, Iterable
+from django.db.models import Exists, OuterRef, Count
+from django.utils.timezone import now
+from discord import Guild, Member, TextChannel, CategoryChannel, ForumChannel, ClientException
 
-from ..utils import get_guild, get_channel, log_errors
+from ..utils import log_errors
 from ..log import Logger, format_exception
+from ..objects import CheckResult
 
 from ..models import (
     AutoRole,
     Guilds,
     GuildConfig,
+    GuildRoles,
     Users,
     UserConfig,
     WelcomeChannels
@@ -23,221 +31,748 @@ if TYPE_CHECKING:
 logger = Logger.DB
 
 
+# Rows per INSERT ... ON CONFLICT when syncing members
+USER_BATCH_SIZE = 2000
+USER_SNAPSHOT_FIELDS = ['guild_name', 'user_name', 'global_name', 'display_name', 'role_ids']
+USER_UPDATE_FIELDS = USER_SNAPSHOT_FIELDS + ['digest']
+GUILD_SNAPSHOT_FIELDS = ['guild_name', 'user_count']
+
+USER_CONFIG_DEFAULTS = {
+    'translate_private': False,
+    'fact_check_private': False,
+    'birthday_notifications': False
+}
+
+# How many checks run at once, and how many Discord REST requests they share
+MAX_CONCURRENT_CHECKS = 3
+MAX_CONCURRENT_REQUESTS = 4
+
+# How long to wait for a guild's member list over the gateway before using REST
+CHUNK_TIMEOUT = 60
+
+# Unchanged guilds still get a full resync once their last one is this old
+FINGERPRINT_MAX_AGE = timedelta(days=7)
+
+
+def snapshot_digest(*values) -> str:
+    """
+    Digest of a row's Discord-side values, stored with the row so unchanged ones aren't rewritten
+    """
+    
+    digest = hashlib.blake2b(digest_size=16)
+    
+    for value in values:
+        digest.update(repr(value).encode("utf-8"))
+        digest.update(b"\0")
+    
+    return digest.hexdigest()
+
+
+def guild_fingerprint(guild: Guild) -> str:
+    """
+    Digest of what the checks reconcile for a guild: its name, member count, roles and channels
+    """
+    
+    digest = hashlib.sha256(f"{guild.name}\0{guild.member_count}\0".encode("utf-8"))
+    
+    for role in sorted(guild.roles, key=lambda role: role.id):
+        digest.update(f"r{role.id}\0{role.name}\0".encode("utf-8"))
+    
+    for channel in sorted(guild.channels, key=lambda channel: channel.id):
+        digest.update(f"c{channel.id}\0{channel.type.value}\0{channel.name}\0".encode("utf-8"))
+    
+    return digest.hexdigest()
+
+
+def depends_on(*checks: str):
+    """
+    Declares the checks that have to finish before the decorated one starts
+    """
+    
+    def decorator(func):
+        func.check_dependencies = checks
+        return func
+    
+    return decorator
+
+
+async def _iterate(members: Iterable[Member]) -> AsyncIterator[Member]:
+    for member in members:
+        yield member
+
+
 class DBManager:
+    """
+    Keeps the DB in sync with the guilds and members the bot can see
+
+    check_all() reconciles everything and is meant for startup, events should use
+    the targeted sync_* / remove_* methods which only touch the affected rows
+
+    Every check_* method is a check, it returns how many rows it touched and declares
+    what it needs with @depends_on. check_all() runs them in dependency order, at most
+    MAX_CONCURRENT_CHECKS at once, all sharing the same REST budget
+
+    Guilds whose fingerprint matches the one stored on their last full reconciliation,
+    and whose member rows still add up, are "fresh" and skipped by the per-guild checks
+    """
+    
     def __init__(self, client: "Client") -> None:
         self.client = client
+        self.rest = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.results: dict[str, CheckResult] = {}
+        self.fresh: set[int] = set()
+        self.unsynced: set[int] = set()
+
+    def _get_checks(self) -> dict[str, Callable[[], Awaitable[Optional[int]]]]:
+        return {
+            name: method
+            for name, method in getmembers(self, ismethod)
+            if name.startswith("check_") and name != "check_all"
+        }
 
-    async def check_all(self) -> None:
+    async def check_all(self) -> dict[str, CheckResult]:
         logger.info("Performing all checks")
         
-        check_methods = []
-        for name, method in getmembers(self, ismethod):
-            if name.startswith("check_") and name != "check_all":
-                check_methods.append(method())
+        checks = self._get_checks()
+        graph = {name: getattr(method, "check_dependencies", ()) for name, method in checks.items()}
+        
+        for name, dependencies in graph.items():
+            for dependency in dependencies:
+                if dependency not in checks:
+                    raise ValueError(f"Check '{name}' depends on unknown check '{dependency}'")
+        
+        sorter = TopologicalSorter(graph)
+        sorter.prepare()
+        
+        fingerprints = {guild.id: guild_fingerprint(guild) for guild in self.client.guilds}
+        
+        try:
+            fresh = await self._find_fresh_guilds(fingerprints)
+        
+        except Exception as e:
+            # Without fingerprints every guild just gets a full resync
+            logger.error(f"Failed to look up guild fingerprints, resyncing every guild: {format_exception(e)}")
+            fresh = set()
+        
+        self.fresh = fresh
+        self.unsynced = set()
         
-        await asyncio.gather(*check_methods)
+        logger.info(f"{len(fresh)} of {len(fingerprints)} guild(s) unchanged since their last reconciliation")
         
-        logger.info("Finished")
+        slots = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+        running: dict[asyncio.Task, str] = {}
+        results: dict[str, CheckResult] = {}
+        started = time.perf_counter()
+        
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                failed = [dependency for dependency in graph[name] if not results[dependency].ok]
+                
+                if failed:
+                    logger.warning(f"Running {name} even though {', '.join(failed)} failed")
+                
+                running[asyncio.create_task(self._run_check(name, checks[name], slots))] = name
+            
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            
+            for task in done:
+                result = task.result()
+                results[result.name] = result
+                sorter.done(running.pop(task))
+        
+        self.results = results
+        self.fresh = set()
+        
+        if all(result.ok for result in results.values()):
+            try:
+                await self._save_fingerprints(fingerprints, fresh)
+            
+            except Exception as e:
+                # Only costs a full resync of these guilds on the next startup
+                logger.error(f"Failed to save guild fingerprints: {format_exception(e)}")
+        else:
+            logger.warning("Not saving guild fingerprints, some checks failed")
+        
+        for result in results.values():
+            logger.info(
+                f"{result.name}: [OK: {result.ok} | Rows: {result.rows} | Duration: {result.duration:.2f}s]"
+            )
+        
+        logger.info(f"Finished in {time.perf_counter() - started:.2f}s")
+        
+        return results
+
+    async def _find_fresh_guilds(self, fingerprints: dict[int, str]) -> set[int]:
+        """
+        Returns the guilds that don't need a full resync
+
+        A guild is fresh if its stored fingerprint matches, its last full resync isn't older
+        than FINGERPRINT_MAX_AGE, and its stored member rows match its member count
+        """
+        
+        cutoff = now() - FINGERPRINT_MAX_AGE
+        candidates = {
+            guild_id
+            async for guild_id, fingerprint in Guilds.objects.filter(
+                guild_id__in=fingerprints.keys(),
+                last_seen__gte=cutoff
+            ).values_list('guild_id', 'fingerprint')
+            if fingerprint == fingerprints[guild_id]
+        }
+        
+        if not candidates:
+            return set()
+        
+        # Cheap verification pass, one aggregate over every candidate
+        stored_counts = {
+            row['guild_id']: row['count']
+            async for row in Users.objects.filter(guild_id__in=candidates)
+                .values('guild_id')
+                .annotate(count=Count('id'))
+        }
+        
+        return {
+            guild_id
+            for guild_id in candidates
+            if stored_counts.get(guild_id, 0) == self.client.get_guild(guild_id).member_count
+        }
+
+    async def _save_fingerprints(self, fingerprints: dict[int, str], fresh: set[int]) -> None:
+        reconciled_at = now()
+        rows = [
+            Guilds(guild_id=guild_id, fingerprint=fingerprint, last_seen=reconciled_at)
+            for guild_id, fingerprint in fingerprints.items()
+            if guild_id not in fresh and guild_id not in self.unsynced
+        ]
+        
+        if rows:
+            await Guilds.objects.abulk_update(rows, ['fingerprint', 'last_seen'])
+
+    async def _run_check(
+            self,
+            name: str,
+            check: Callable[[], Awaitable[Optional[int]]],
+            slots: asyncio.Semaphore
+    ) -> CheckResult:
+        async with slots:
+            started = time.perf_counter()
+            rows: Optional[int] = await check()
+            
+            return CheckResult(
+                name=name,
+                duration=time.perf_counter() - started,
+                rows=rows or 0,
+                ok=rows is not None
+            )
 
     @log_errors(logger, is_async=True)
-    async def check_auto_role(self) -> None:
+    async def check_auto_role(self) -> int:
         logger.info("Checking auto roles")
-                
-        async for auto_role in AutoRole.objects.all():
-            guild = await get_guild(self.client, auto_role.guild_id)
+        
+        stale: list[int] = []
+        renamed: list[AutoRole] = []
+        auto_roles = AutoRole.objects.exclude(guild_id__in=self.fresh)
+        
+        for guild_id, guild_roles in (await self._group_by_guild(auto_roles)).items():
+            guild = self.client.get_guild(guild_id)
             
             if not guild:
-                logger.info(f"Guild {auto_role.guild_id} no longer exists or I'm not in it")
-                await auto_role.adelete()
+                logger.info(f"Guild {guild_id} no longer exists or I'm not in it")
+                stale.extend(auto_role.pk for auto_role in guild_roles)
                 
                 continue
             
-            if guild.name != auto_role.guild_name:
-                auto_role.guild_name = guild.name
-                await auto_role.asave(update_fields=['guild_name'])
-            
-            role = guild.get_role(auto_role.role_id)
-            
-            if not role:
-                logger.info(f"Role {auto_role.role_id} no longer exists in guild {guild.name}")
-                await auto_role.adelete()
-                
+            if guild.unavailable:
                 continue
             
-            if role.name != auto_role.role_name:
-                auto_role.role_name = role.name
-                await auto_role.asave(update_fields=['role_name'])
+            for auto_role in guild_roles:
+                role = guild.get_role(auto_role.role_id)
+                
+                if not role:
+                    logger.info(f"Role {auto_role.role_id} no longer exists in guild {guild.name}")
+                    stale.append(auto_role.pk)
+                    
+                    continue
+                
+                if (guild.name, role.name) != (auto_role.guild_name, auto_role.role_name):
+                    auto_role.guild_name = guild.name
+                    auto_role.role_name = role.name
+                    renamed.append(auto_role)
+        
+        return await self._apply_changes(AutoRole, stale, renamed, ['guild_name', 'role_name'])
 
     @log_errors(logger, is_async=True)
-    async def check_guilds(self) -> None:
+    async def check_guilds(self) -> int:
         logger.info("Checking guilds")
         
         bot_guilds = self.client.guilds
         bot_guild_ids = [guild.id for guild in bot_guilds]
+        stored = {
+            guild_id: digest
+            async for guild_id, digest in Guilds.objects.values_list('guild_id', 'digest')
+        }
+        
+        deleted, _ = await Guilds.objects.exclude(guild_id__in=bot_guild_ids).adelete()
+        
+        if deleted:
+            logger.info(f"Removed {deleted} row(s) of guilds that no longer exist or I'm not in")
+        
+        changed: list[Guilds] = []
         
-        async for guild in Guilds.objects.all():
-            if guild.guild_id not in bot_guild_ids:
-                logger.info(f"Guild {guild.guild_id} no longer exists or I'm not in it")
-                await guild.adelete()
-                
         for guild in bot_guilds:
-            _, created = await Guilds.objects.aupdate_or_create(
-                guild_id=guild.id,
-                defaults={
-                    'guild_name': guild.name,
-                    'user_count': guild.member_count
-                }
-            )
+            row = Guilds(guild_id=guild.id, **self._guild_defaults(guild))
             
-            if created:
-                logger.info(f"Added missing: {guild.name} ({guild.id})")
-            else:
-                logger.info(f"Updated: {guild.name} ({guild.id})")
+            if stored.get(guild.id) != row.digest:
+                changed.append(row)
+                logger.info(f"{'Updated' if guild.id in stored else 'Added missing'}: {guild.name} ({guild.id})")
+        
+        if changed:
+            await Guilds.objects.abulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=['guild_id'],
+                update_fields=GUILD_SNAPSHOT_FIELDS + ['digest']
+            )
+        
+        self._log_skip_ratio("guild", len(bot_guilds), len(changed))
+        
+        return deleted + len(changed)
 
+    @depends_on("check_guilds")
     @log_errors(logger, is_async=True)
-    async def check_guild_config(self) -> None:
+    async def check_guild_config(self) -> int:
         logger.info("Checking guild configurations")
         
-        guilds = Guilds.objects.all()
+        # One anti-join SELECT for the missing ones and one INSERT for all of them
+        missing = Guilds.objects.filter(config__isnull=True).values_list('guild_id', flat=True)
+        created = await GuildConfig.objects.abulk_create(
+            [GuildConfig(guild_id=guild_id, spam_filter_action=0) async for guild_id in missing],
+            ignore_conflicts=True
+        )
         
-        async for guild in guilds:
-            try:
-                _, created = await GuildConfig.objects.aget_or_create(
-                    guild=guild,
-                    defaults={
-                        'spam_filter_action': 0
-                    }
-                )
-                
-                if created:
-                    logger.info(f"Added missing: {guild.guild_name} ({guild.guild_id})")
-            
-            except Exception as e:
-                logger.error(
-                    f"Error creating config for guild {guild.guild_name} ({guild.guild_id}): {format_exception(e)}"
-                )
+        if created:
+            logger.info(f"Added {len(created)} missing guild configuration(s)")
         
-        orphaned_configs = GuildConfig.objects.filter(~Q(guild__in=guilds))
-        count = await orphaned_configs.acount()
+        orphaned_configs = GuildConfig.objects.filter(~Exists(Guilds.objects.filter(guild_id=OuterRef('guild_id'))))
+        count, _ = await orphaned_configs.adelete()
         
         if count > 0:
-            logger.info(f"Removing {count} orphaned guild configurations.")
-            await orphaned_configs.adelete()
+            logger.info(f"Removed {count} orphaned guild configuration(s)")
+        
+        return len(created) + count
 
     @log_errors(logger, is_async=True)
-    async def check_users(self) -> None:
+    async def check_users(self) -> int:
         logger.info("Checking users")
         
         bot_guilds = self.client.guilds
-        db_users = Users.objects.all()
-        valid_user_guilds = set()
+        stale_guilds = [guild for guild in bot_guilds if guild.id not in self.fresh]
         
-        for guild in bot_guilds:
+        logger.info(f"Syncing members of {len(stale_guilds)} guild(s), skipping {len(bot_guilds) - len(stale_guilds)}")
+        
+        async def sync(guild: Guild) -> tuple[int, int, int]:
             try:
-                async for member in guild.fetch_members(limit=None):
-                    try:
-                        valid_user_guilds.add((guild.id, member.id))
-                        role_names = [role.name for role in member.roles if role.name != "@everyone"]
-                        
-                        _, created = await Users.objects.aupdate_or_create(
-                            guild_id=guild.id,
-                            user_id=member.id,
-                            defaults={
-                                'guild_name': guild.name,
-                                'user_name': member.name,
-                                'global_name': member.global_name or member.name,
-                                'display_name': member.display_name,
-                                'roles': role_names
-                            }
-                        )
-                        
-                        if created:
-                            logger.debug(f"Added missing: {member.display_name} ({member.id}) in {guild.name}")
-                    
-                    except Exception as e:
-                        logger.error(f"Error updating user {member.id} in guild {guild.id}: {format_exception(e)}")
+                roles = await self._sync_guild_roles(guild)
+                members, written, deleted = await self._sync_guild_users(guild)
+                logger.info(f"Wrote {written} changed user(s) and removed {deleted} in {guild.name} ({guild.id})")
+                
+                return members, written, roles + deleted
             
             except Exception as e:
-                logger.error(f"Error fetching members for guild {guild.name} ({guild.id}): {format_exception(e)}")
+                logger.error(f"Error syncing members for guild {guild.name} ({guild.id}): {format_exception(e)}")
+                self.unsynced.add(guild.id)
+                
+                return 0, 0, 0
         
-        async for user in db_users:
-            if (user.guild_id, user.user_id) not in valid_user_guilds:
-                logger.info(
-                    f"User {user.display_name} ({user.user_id}) is not in {user.guild_name} ({user.guild_id}). "\
-                )
-                await user.adelete()
+        # Guilds sync concurrently, the REST budget keeps it to a few member streams at a time
+        synced = await asyncio.gather(*(sync(guild) for guild in stale_guilds))
+        members = sum(result[0] for result in synced)
+        written = sum(result[1] for result in synced)
+        rows = written + sum(result[2] for result in synced)
+        
+        self._log_skip_ratio("member", members, written)
+        
+        bot_guild_ids = [guild.id for guild in bot_guilds]
+        deleted, _ = await Users.objects.exclude(guild_id__in=bot_guild_ids).adelete()
+        
+        if deleted:
+            logger.info(f"Removed {deleted} user row(s) of guilds I'm no longer in")
+        
+        roles_deleted, _ = await GuildRoles.objects.exclude(guild_id__in=bot_guild_ids).adelete()
+        
+        return rows + deleted + roles_deleted
 
-    @log_errors(logger, is_async=True)
-    async def check_user_config(self) -> None:
-        logger.info("Checking user configurations")
+    async def _sync_guild_users(self, guild: Guild) -> tuple[int, int, int]:
+        """
+        Streams a guild's members into batched upserts and deletes whoever left
+
+        Members whose stored digest matches (names and role set) aren't written
+
+        Returns:
+            tuple[int, int, int]: How many members the guild has, how many rows were written and deleted
+        """
+        
+        stored = {
+            user_id: digest
+            async for user_id, digest in Users.objects.filter(guild_id=guild.id).values_list('user_id', 'digest')
+        }
         
-        users = Users.objects.all()
+        present: set[int] = set()
+        batch: list[Users] = []
+        written = 0
+        started = time.perf_counter()
+        source, members = await self._get_members(guild)
         
-        async for user in users:
+        async for member in members:
+            present.add(member.id)
+            row = self._user_row(member)
+            
+            if stored.get(member.id) == row.digest:
+                continue
+            
+            batch.append(row)
+            
+            if len(batch) >= USER_BATCH_SIZE:
+                await self._upsert_users(batch)
+                written += len(batch)
+                batch = []
+        
+        if batch:
+            await self._upsert_users(batch)
+            written += len(batch)
+        
+        logger.info(
+            f"Loaded {len(present)} member(s) of {guild.name} ({guild.id}) from {source} " \
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        
+        departed = [user_id for user_id in stored if user_id not in present]
+        deleted = 0
+        
+        for i in range(0, len(departed), USER_BATCH_SIZE):
+            count, _ = await Users.objects.filter(
+                guild_id=guild.id,
+                user_id__in=departed[i:i + USER_BATCH_SIZE]
+            ).adelete()
+            deleted += count
+        
+        return len(present), written, deleted
+
+    async def _sync_guild_roles(self, guild: Guild) -> int:
+        """
+        Stores a guild's role names once, so renaming a role doesn't touch its members' rows
+
+        Returns:
+            int: How many roles were written or deleted
+        """
+        
+        stored = {
+            role_id: role_name
+            async for role_id, role_name in GuildRoles.objects.filter(guild_id=guild.id)
+                .values_list('role_id', 'role_name')
+        }
+        
+        changed = [
+            GuildRoles(role_id=role.id, guild_id=guild.id, role_name=role.name)
+            for role in guild.roles
+            if not role.is_default() and stored.get(role.id) != role.name
+        ]
+        
+        if changed:
+            await GuildRoles.objects.abulk_create(
+                changed,
+                update_conflicts=True,
+                unique_fields=['role_id'],
+                update_fields=['guild_id', 'role_name']
+            )
+        
+        deleted = 0
+        removed = stored.keys() - {role.id for role in guild.roles}
+        
+        if removed:
+            deleted, _ = await GuildRoles.objects.filter(role_id__in=removed).adelete()
+        
+        return len(changed) + deleted
+
+    async def _get_members(self, guild: Guild) -> tuple[str, AsyncIterator[Member]]:
+        """
+        Picks the cheapest complete source for a guild's member list
+
+        The gateway cache if the guild is already chunked, a gateway chunk request if the
+        members intent is on, and paging through REST as the last resort
+
+        Returns:
+            tuple[str, AsyncIterator[Member]]: The source's name ("cache", "gateway" or "rest") and the members
+        """
+        
+        if guild.chunked:
+            return "cache", _iterate(guild.members)
+        
+        if self.client.intents.members:
             try:
-                _, created = await UserConfig.objects.aget_or_create(
-                    user=user,
-                    defaults={
-                        'translate_private': False,
-                        'fact_check_private': False,
-                        'birthday_notifications': False
-                    }
-                )
+                members = await asyncio.wait_for(guild.chunk(cache=True), timeout=CHUNK_TIMEOUT)
+                
+                if guild.member_count is None or len(members) >= guild.member_count:
+                    return "gateway", _iterate(members)
                 
-                if created:
-                    logger.debug(f"Added missing: {user.display_name} ({user.user_id}) in {user.guild_name}")
+                logger.warning(
+                    f"Gateway returned {len(members)} of {guild.member_count} member(s) " \
+                    f"for {guild.name} ({guild.id}), falling back to REST"
+                )
             
-            except Exception as e:
-                logger.error(
-                    f"Error creating config for user {user.display_name} ({user.user_id}): {format_exception(e)}"
+            except (asyncio.TimeoutError, ClientException) as e:
+                logger.warning(
+                    f"Failed to chunk {guild.name} ({guild.id}), falling back to REST: {format_exception(e)}"
                 )
         
-        orphaned_configs = UserConfig.objects.filter(~Q(user__in=users))
-        count = await orphaned_configs.acount()
+        return "rest", self._fetch_members(guild)
+
+    async def _fetch_members(self, guild: Guild) -> AsyncIterator[Member]:
+        async with self.rest:
+            async for member in guild.fetch_members(limit=None):
+                yield member
+
+    @staticmethod
+    async def _upsert_users(batch: list[Users]) -> None:
+        await Users.objects.abulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['guild_id', 'user_id'],
+            update_fields=USER_UPDATE_FIELDS
+        )
+
+    @depends_on("check_users")
+    @log_errors(logger, is_async=True)
+    async def check_user_config(self) -> int:
+        logger.info("Checking user configurations")
+        
+        # One anti-join SELECT for the missing ones and one INSERT for all of them
+        missing = Users.objects.filter(config__isnull=True).values_list('pk', flat=True)
+        created = await UserConfig.objects.abulk_create(
+            [UserConfig(user_id=user_pk, **USER_CONFIG_DEFAULTS) async for user_pk in missing],
+            ignore_conflicts=True
+        )
+        
+        if created:
+            logger.info(f"Added {len(created)} missing user configuration(s)")
+        
+        orphaned_configs = UserConfig.objects.filter(~Exists(Users.objects.filter(pk=OuterRef('user_id'))))
+        count, _ = await orphaned_configs.adelete()
         
         if count > 0:
-            logger.info(f"Removing {count} orphaned user configurations.")
-            await orphaned_configs.adelete()
+            logger.info(f"Removed {count} orphaned user configuration(s)")
+        
+        return len(created) + count
 
     @log_errors(logger, is_async=True)
-    async def check_welcome_channels(self) -> None:
+    async def check_welcome_channels(self) -> int:
         logger.info("Checking welcome channels")
-            
-        welcome_channels = WelcomeChannels.objects.all()
         
-        async for welcome_channel in welcome_channels:
-            guild = await get_guild(self.client, welcome_channel.guild_id)
+        stale: list[int] = []
+        renamed: list[WelcomeChannels] = []
+        welcome_channels = WelcomeChannels.objects.exclude(guild_id__in=self.fresh)
+        
+        for guild_id, guild_channels in (await self._group_by_guild(welcome_channels)).items():
+            guild = self.client.get_guild(guild_id)
             
             if not guild:
-                logger.info(f"Guild {welcome_channel.guild_id} no longer exists or I'm not in it")
-                await welcome_channel.adelete()
+                logger.info(f"Guild {guild_id} no longer exists or I'm not in it")
+                stale.extend(welcome_channel.pk for welcome_channel in guild_channels)
                 
                 continue
             
-            if guild.name != welcome_channel.guild_name:
-                welcome_channel.guild_name = guild.name
-                await welcome_channel.asave(update_fields=['guild_name'])
-            
-            channel = await get_channel(self.client, welcome_channel.channel_id)
-            
-            if not channel:
-                logger.info(
-                    f"Channel {welcome_channel.channel_id} no longer exists in " \
-                    f"{guild.name} (ID: {welcome_channel.guild_id})"
-                )
-                await welcome_channel.adelete()
-                
+            if guild.unavailable:
                 continue
             
-            if not isinstance(channel, (TextChannel, ForumChannel, CategoryChannel)):
-                logger.info(
-                    f"Channel {welcome_channel.channel_id} in guild {guild.name} is not a text channel, " \
-                    "forum channel, or category"
-                )
-                await welcome_channel.adelete()
+            for welcome_channel in guild_channels:
+                channel = guild.get_channel(welcome_channel.channel_id)
                 
-                continue
-            
-            if channel.name != welcome_channel.channel_name:
-                welcome_channel.channel_name = channel.name
-                await welcome_channel.asave(update_fields=['channel_name'])
+                if not channel:
+                    logger.info(
+                        f"Channel {welcome_channel.channel_id} no longer exists in " \
+                        f"{guild.name} (ID: {welcome_channel.guild_id})"
+                    )
+                    stale.append(welcome_channel.pk)
+                    
+                    continue
+                
+                if not isinstance(channel, (TextChannel, ForumChannel, CategoryChannel)):
+                    logger.info(
+                        f"Channel {welcome_channel.channel_id} in guild {guild.name} is not a text channel, " \
+                        "forum channel, or category"
+                    )
+                    stale.append(welcome_channel.pk)
+                    
+                    continue
+                
+                if (guild.name, channel.name) != (welcome_channel.guild_name, welcome_channel.channel_name):
+                    welcome_channel.guild_name = guild.name
+                    welcome_channel.channel_name = channel.name
+                    renamed.append(welcome_channel)
+        
+        return await self._apply_changes(WelcomeChannels, stale, renamed, ['guild_name', 'channel_name'])
+
+    @staticmethod
+    async def _group_by_guild(queryset) -> dict[int, list]:
+        groups: dict[int, list] = defaultdict(list)
+        
+        async for row in queryset:
+            groups[row.guild_id].append(row)
+        
+        return groups
+
+    @staticmethod
+    async def _apply_changes(model, stale: list[int], renamed: list, fields: list[str]) -> int:
+        """
+        Deletes stale rows and saves renamed ones, one statement each
+
+        Returns:
+            int: How many rows were touched
+        """
+        
+        deleted = 0
+        
+        if stale:
+            deleted, _ = await model.objects.filter(pk__in=stale).adelete()
+        
+        if renamed:
+            await model.objects.abulk_update(renamed, fields)
+        
+        return deleted + len(renamed)
+
+    @classmethod
+    def _user_row(cls, member: Member) -> Users:
+        return Users(guild_id=member.guild.id, user_id=member.id, **cls._user_defaults(member))
+
+    @staticmethod
+    def _user_defaults(member: Member) -> dict:
+        snapshot = {
+            'guild_name': member.guild.name,
+            'user_name': member.name,
+            'global_name': member.global_name or member.name,
+            'display_name': member.display_name,
+            'role_ids': sorted(role.id for role in member.roles if not role.is_default())
+        }
+        snapshot['digest'] = snapshot_digest(*(snapshot[field] for field in USER_SNAPSHOT_FIELDS))
+        
+        return snapshot
+
+    @staticmethod
+    def _guild_defaults(guild: Guild) -> dict:
+        # Every writer of a guild row goes through here so its digest never goes stale
+        snapshot = {
+            'guild_name': guild.name,
+            'user_count': guild.member_count
+        }
+        snapshot['digest'] = snapshot_digest(*(snapshot[field] for field in GUILD_SNAPSHOT_FIELDS))
+        
+        return snapshot
+
+    @staticmethod
+    def _log_skip_ratio(kind: str, total: int, written: int) -> None:
+        skipped = total - written
+        ratio = skipped / total if total else 1.0
+        
+        logger.info(f"Skipped {skipped} of {total} unchanged {kind} row(s) ({ratio:.1%}), wrote {written}")
+
+    @log_errors(logger, is_async=True)
+    async def sync_member(self, member: Member) -> None:
+        """
+        Upserts a single member along with their config and their guild's member count
+        """
+        
+        guild = member.guild
+        
+        user, created = await Users.objects.aupdate_or_create(
+            guild_id=guild.id,
+            user_id=member.id,
+            defaults=self._user_defaults(member)
+        )
+        
+        await UserConfig.objects.aget_or_create(user=user, defaults=USER_CONFIG_DEFAULTS)
+        await Guilds.objects.filter(guild_id=guild.id).aupdate(**self._guild_defaults(guild))
+        
+        if created:
+            logger.info(f"Added member: {member.display_name} ({member.id}) in {guild.name}")
+
+    @log_errors(logger, is_async=True)
+    async def sync_members(self, guild: Guild, members: list[Member]) -> None:
+        """
+        Upserts a batch of members who joined a guild along with their configs
+
+        Costs the same four queries however many members there are, the join queue
+        calls it once per burst instead of sync_member() once per join
+        """
+        
+        if not members:
+            return
+        
+        await self._upsert_users([self._user_row(member) for member in members])
+        
+        missing = Users.objects.filter(
+            guild_id=guild.id,
+            user_id__in=[member.id for member in members],
+            config__isnull=True
+        ).values_list('pk', flat=True)
+        
+        await UserConfig.objects.abulk_create(
+            [UserConfig(user_id=user_pk, **USER_CONFIG_DEFAULTS) async for user_pk in missing],
+            ignore_conflicts=True
+        )
+        
+        await Guilds.objects.filter(guild_id=guild.id).aupdate(**self._guild_defaults(guild))
+        
+        logger.info(f"Synced {len(members)} joined member(s) in {guild.name}")
+
+    @log_errors(logger, is_async=True)
+    async def remove_member(self, member: Member) -> None:
+        """
+        Removes a member who left a guild, their config goes with them
+        """
+        
+        guild = member.guild
+        
+        await Users.objects.filter(guild_id=guild.id, user_id=member.id).adelete()
+        await Guilds.objects.filter(guild_id=guild.id).aupdate(**self._guild_defaults(guild))
+        
+        logger.info(f"Removed member: {member.display_name} ({member.id}) from {guild.name}")
+
+    @log_errors(logger, is_async=True)
+    async def sync_guild(self, guild: Guild) -> None:
+        """
+        Upserts a single guild, its config, and all of its members with their configs
+        """
+        
+        guild_row, _ = await Guilds.objects.aupdate_or_create(
+            guild_id=guild.id,
+            defaults=self._guild_defaults(guild)
+        )
+        
+        await GuildConfig.objects.aget_or_create(guild=guild_row, defaults={'spam_filter_action': 0})
+        
+        await self._sync_guild_roles(guild)
+        count, _, _ = await self._sync_guild_users(guild)
+        
+        missing = Users.objects.filter(guild_id=guild.id, config__isnull=True)
+        await UserConfig.objects.abulk_create(
+            [UserConfig(user=user, **USER_CONFIG_DEFAULTS) async for user in missing],
+            batch_size=USER_BATCH_SIZE,
+            ignore_conflicts=True
+        )
+        
+        logger.info(f"Synced guild: {guild.name} ({guild.id}) with {count} member(s)")
+
+    @log_errors(logger, is_async=True)
+    async def remove_guild(self, guild: Guild) -> None:
+        """
+        Removes a guild the bot left along with everything stored for it
+        """
+        
+        # GuildConfig and UserConfig cascade
+        await Guilds.objects.filter(guild_id=guild.id).adelete()
+        await Users.objects.filter(guild_id=guild.id).adelete()
+        await GuildRoles.objects.filter(guild_id=guild.id).adelete()
+        await AutoRole.objects.filter(guild_id=guild.id).adelete()
+        await WelcomeChannels.objects.filter(guild_id=guild.id).adelete()
+        
+        logger.info(f"Removed guild: {guild.name} ({guild.id})")
@@ -9,9 +9,9 @@ from secrets import token_urlsafe
 from .conf import conf
 from .checks import db, startup
 from .log import Logger, log_exception, format_exception, BOLD, RESET
-from .managers import events, tasks, locale, extensions
+from .managers import events, tasks, locale, extensions, spam, settings, joins, resolver
 from .helpers import generate_intents
-from .tree import TreeSync,on_error
+from .tree import TreeSync, on_error, interaction_check
 from .objects import TTSClient
 
 logger = Logger.CLIENT
@@ -26,10 +26,21 @@ class Client(Bot):
         )
 
         self.tree.on_error = on_error
+        self.tree.interaction_check = interaction_check
         self.tts_clients: dict[int, TTSClient] = {}
         self.music_clients: dict[int, object] = {}  # TODO: Add music client type
         self.task_handler = tasks.TaskManager(self)
         self.db_manager = db.DBManager(self)
+        self.spam_tracker = spam.SpamTracker(conf.spam_filter.time_window, conf.spam_filter.max_per_window)
+        self.spam_cleaner = spam.SpamCleaner(conf.spam_filter.flush_interval)
+        self.guild_settings = settings.GuildSettingsCache()
+        self.resolver = resolver.Resolver()
+        self.join_queue = joins.JoinQueue(
+            self,
+            conf.join_burst.window,
+            conf.join_burst.threshold,
+            conf.join_burst.role_interval
+        )
         self.sync_mgr = TreeSync(self)
         self._owner_token = None
     
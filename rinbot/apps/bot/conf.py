@@ -3,6 +3,7 @@ from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 
 from .paths import Path
+from .cache import content_hash, read_cache, write_cache
 
 
 class _Status(BaseModel):
@@ -15,6 +16,13 @@ class _SpamFilter(BaseModel):
     enabled: bool
     time_window: int
     max_per_window: int
+    flush_interval: float = 0.5
+
+
+class _JoinBurst(BaseModel):
+    window: float = 2.0
+    threshold: int = 5
+    role_interval: float = 1.0
 
 
 class _Danbooru(BaseModel):
@@ -51,9 +59,11 @@ class Config(BaseModel):
     always_sync: bool
     status: _Status
     spam_filter: _SpamFilter = Field(alias="spam-filter")
+    join_burst: _JoinBurst = Field(alias="join-burst", default_factory=_JoinBurst)
     nsfw_extensions: _NSFWExtensions = Field(alias="nsfw-extensions")
     lavalink: _Lavalink
     testing_servers: Optional[List[int]] = Field(alias="testing-servers", default_factory=list)
+    locale_fallbacks: Dict[str, List[str]] = Field(alias="locale-fallbacks", default_factory=dict)
     tasks: List[str]
     internal_extensions: List[str] = Field(alias="internal-extensions")
     intents: Dict[str, bool]
@@ -61,13 +71,22 @@ class Config(BaseModel):
 
 def load_config() -> Config:
     try:
+        digest = content_hash([Path.CONFIG.value])
+        data: Optional[Dict[str, Any]] = read_cache(Path.CONFIG_CACHE.value, digest)
+
+        if data is not None:
+            return Config.model_validate(data)
+
         with open(Path.CONFIG.value, encoding="utf-8") as f:
-            data: Dict[str, Any] = yaml.safe_load(f)
+            data = yaml.safe_load(f)
 
         if not data:
             raise ValueError("Config file is empty or invalid")
 
-        return Config.model_validate(data)
+        config = Config.model_validate(data)
+        write_cache(Path.CONFIG_CACHE.value, digest, data)
+
+        return config
     
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found at {Path.CONFIG.value}")
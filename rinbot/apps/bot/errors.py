@@ -4,7 +4,7 @@ from discord import Interaction, Embed, Colour, DMChannel
 from discord.app_commands import CheckFailure
 from discord.ext.commands import Context
 
-from .managers.locale import get_interaction_locale, get_localised_string
+from .managers.locale import get_locale_context
 from .log import Logger
 from .utils import get_full_command
 from .responder import respond
@@ -25,8 +25,8 @@ class InteractionTimedOut(Exception):
 
     @staticmethod
     async def __do_action(interaction: Context | Interaction) -> None:
-        locale = get_interaction_locale(interaction)
-        msg = get_localised_string(locale, "error_timeout")
+        locale = get_locale_context(interaction)
+        msg = locale.t("error_timeout")
         embed = Embed(description=msg, colour=Colour.yellow())
 
         await interaction.edit_original_response(content=None, embed=embed, view=None)
@@ -51,9 +51,9 @@ class UserNotOwner(RinBotError, CheckFailure):
             f"(ID: {guild.id if guild else author.id}) | In channel: {channel}]"
         )
         
-        locale = get_interaction_locale(interaction)
-        msg = get_localised_string(locale, "error_not_owner")
-        empty_msg = get_localised_string(locale, "error_owners_empty")
+        locale = get_locale_context(interaction)
+        msg = locale.t("error_not_owner")
+        empty_msg = locale.t("error_owners_empty")
         
         await respond(interaction, Colour.red(), msg, hidden=True)
         
@@ -78,8 +78,8 @@ class UserNotAdmin(RinBotError, CheckFailure):
             f"(ID: {guild.id if guild else author.id}) | In channel: {channel.name if channel else ''}]"
         )
         
-        locale = get_interaction_locale(interaction)
-        msg = get_localised_string(locale, "error_not_admin")
+        locale = get_locale_context(interaction)
+        msg = locale.t("error_not_admin")
         
         await respond(interaction, Colour.red(), msg, hidden=True)
 
@@ -101,8 +101,8 @@ class UserBlacklisted(RinBotError, CheckFailure):
             f"(ID: {guild.id if guild else author.id}) | In channel: {channel.name if channel else ''}]"
         )
         
-        locale = get_interaction_locale(interaction)
-        msg = get_localised_string(locale, "error_blacklisted")
+        locale = get_locale_context(interaction)
+        msg = locale.t("error_blacklisted")
         
         await respond(interaction, Colour.red(), msg, hidden=True)
 
@@ -121,7 +121,7 @@ class UserNotInGuild(RinBotError, CheckFailure):
             f"[Command: {command} | Who: {author.name if author else ''} (ID: {author.id if author else 0})]"
         )
         
-        locale = get_interaction_locale(interaction)
-        msg = get_localised_string(locale, "error_not_in_guild")
+        locale = get_locale_context(interaction)
+        msg = locale.t("error_not_in_guild")
         
         await respond(interaction, Colour.red(), msg, hidden=True)
@@ -15,7 +15,7 @@ RinBot's config command cog
 """
 
 from typing import Optional
-from discord import Interaction, Embed, Role, TextChannel
+from discord import Interaction, Role, TextChannel
 
 from discord.ext.commands import (
     has_permissions,
@@ -41,13 +41,14 @@ from ..models import GuildConfig, WelcomeChannels, UserConfig, AutoRole
 from ..ui import WelcomeConfirmation
 from ..checks import commands
 from ..log import Logger
-from ..managers.locale import get_interaction_locale, get_localised_string
+from ..managers.locale import get_locale_context
 from ..responder import respond
 from ..subclasses import Cog
 from ..client import Client
-from ..helpers import is_hex_colour, hex_to_colour, bool_choice
+from ..helpers import is_hex_colour, bool_choice
 from ..utils import get_user_avatar
 from ..objects import Response, CommandOptions
+from ..templates import WelcomeTemplate
 
 logger = Logger.COMMANDS
 
@@ -94,6 +95,8 @@ class Config(Cog, name="config"):
             }
         )
         
+        await self.client.guild_settings.refresh(interaction.guild.id)
+        
         if created:
             await self.respond_with_success(interaction, "config_conf_ar_success", role=role.name)
         else:
@@ -106,11 +109,15 @@ class Config(Cog, name="config"):
     )
     @rename(
         action=locale_str("config_conf_sf_action"),
-        message=locale_str("config_conf_sf_message")
+        message=locale_str("config_conf_sf_message"),
+        time_window=locale_str("config_conf_sf_time_window"),
+        max_per_window=locale_str("config_conf_sf_max_per_window")
     )
     @describe(
         action=locale_str("config_conf_sf_action_desc"),
-        message=locale_str("config_conf_sf_message_desc")
+        message=locale_str("config_conf_sf_message_desc"),
+        time_window=locale_str("config_conf_sf_time_window_desc"),
+        max_per_window=locale_str("config_conf_sf_max_per_window_desc")
     )
     @choices(
         action=[
@@ -123,7 +130,14 @@ class Config(Cog, name="config"):
     # @commands.is_admin()
     @bot_has_permissions(manage_messages=True)
     @has_permissions(manage_messages=True)
-    async def spam_filter(self, interaction: Interaction, action: Choice[int], message: str) -> None:
+    async def spam_filter(
+            self,
+            interaction: Interaction,
+            action: Choice[int],
+            message: str,
+            time_window: Optional[Range[int, 1, 300]] = None,
+            max_per_window: Optional[Range[int, 1, 100]] = None
+    ) -> None:
         _, created = await GuildConfig.objects.aupdate_or_create(
             guild_id=interaction.guild.id,
             defaults={
@@ -131,10 +145,14 @@ class Config(Cog, name="config"):
                 "guild_name": interaction.guild.name,
                 "spam_filter_action": action.value,
                 "spam_filter_message": message,
-                "spam_filter_original_state": action.value
+                "spam_filter_original_state": action.value,
+                "spam_time_window": time_window,
+                "spam_max_per_window": max_per_window
             }
         )
         
+        await self.client.guild_settings.refresh(interaction.guild.id)
+        
         if created:
             await self.respond_with_success(interaction, "config_conf_sf_success", hidden=True)
         else:
@@ -179,33 +197,15 @@ class Config(Cog, name="config"):
             show_pfp: Choice[int],
             colour: Range[str, 7, 7]
     ) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         if not is_hex_colour(colour):
             return await self.respond_with_failure(interaction, "config_conf_wc_invalid_colour", hidden=True)
         
         await interaction.response.defer(ephemeral=True)
         
-        example = Embed(
-            title=title,
-            description=description,
-            colour=hex_to_colour(colour)
-        )
-        
-        if title and '<username>' in title:
-            example.title = title.replace('<username>', interaction.user.display_name)
-        
-        if description and '<username>' in description:
-            example.description = description.replace('<username>', interaction.user.display_name)
-        if description and '<mention>' in description:
-            example.description = description.replace('<mention>', interaction.user.mention)
-        
-        avatar_url = await get_user_avatar(interaction.user)
-                
-        if show_pfp.value == 1:
-            example.set_thumbnail(url=avatar_url)
-        elif show_pfp.value == 2:
-            example.set_image(url=avatar_url)
+        template = WelcomeTemplate(title, description, colour, show_pfp.value)
+        example = template.render(interaction.user, await get_user_avatar(interaction.user))
         
         confirmation = WelcomeConfirmation(interaction)
         
@@ -214,7 +214,7 @@ class Config(Cog, name="config"):
             message=example,
             view=confirmation,
             resp_type=Response.FOLLOWUP,
-            outside_content=get_localised_string(locale, "config_conf_wc_welcome_info"),
+            outside_content=locale.t("config_conf_wc_welcome_info"),
             hidden=True
         )
         
@@ -241,6 +241,8 @@ class Config(Cog, name="config"):
                 'colour': colour
             }
         )
+        
+        await self.client.guild_settings.refresh(interaction.guild.id)
     
     # /configure-user translate-private
     @conf_us_gp.command(
@@ -252,7 +254,7 @@ class Config(Cog, name="config"):
     @choices(private=CommandOptions.BASIC_CONFIRMATION)
     @commands.not_blacklisted()
     async def translate_private(self, interaction: Interaction, private: Choice[int]) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         private = bool_choice(private)
         
         await UserConfig.objects.aupdate(
@@ -264,7 +266,7 @@ class Config(Cog, name="config"):
             interaction,
             "config_conf_us_tp_success",
             hidden=True,
-            private=get_localised_string(locale, "on" if private else "off").lower()
+            private=locale.t("on" if private else "off").lower()
         )
     
     # /configure-user fact-check-private
@@ -277,7 +279,7 @@ class Config(Cog, name="config"):
     @choices(private=CommandOptions.BASIC_CONFIRMATION)
     @commands.not_blacklisted()
     async def fact_check_private(self, interaction: Interaction, private: Choice[int]) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         private = bool_choice(private)
         
         await UserConfig.objects.aupdate(
@@ -289,7 +291,7 @@ class Config(Cog, name="config"):
             interaction,
             "config_conf_us_fc_success",
             hidden=True,
-            private=get_localised_string(locale, "on" if private else "off").lower()
+            private=locale.t("on" if private else "off").lower()
         )
     
     # /toggle
@@ -311,7 +313,7 @@ class Config(Cog, name="config"):
     @allowed_installs(AppInstallationType(guild=True, user=False))
     @commands.not_blacklisted()
     async def toggle(self, interaction: Interaction, feature: Choice[str]) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         feature = feature.value
         
         # Auto-role
@@ -323,6 +325,8 @@ class Config(Cog, name="config"):
                 guild_id=interaction.guild.id,
                 defaults={"active": new_state}
             )
+            
+            await self.client.guild_settings.refresh(interaction.guild.id)
         
         # Spam filter
         if feature == "spam-filter":
@@ -344,6 +348,8 @@ class Config(Cog, name="config"):
                     guild_id=interaction.guild.id,
                     defaults={"spam_filter_action": new_spam_state}
                 )
+            
+            await self.client.guild_settings.refresh(interaction.guild.id)
         
         # Welcome channel
         if feature == "welcome-channel":
@@ -354,6 +360,8 @@ class Config(Cog, name="config"):
                 guild_id=interaction.guild.id,
                 defaults={"active": new_state}
             )
+            
+            await self.client.guild_settings.refresh(interaction.guild.id)
         
         # Birthday notifications
         if feature == "birthday-notifications":
@@ -370,7 +378,7 @@ class Config(Cog, name="config"):
             "config_toggle_success",
             hidden=True,
             feature=feature,
-            state=get_localised_string(locale, "on" if new_state else "off").lower()
+            state=locale.t("on" if new_state else "off").lower()
         )
 
 # Setup
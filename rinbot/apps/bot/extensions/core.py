@@ -41,7 +41,7 @@ from ..models import Admins, Owners
 from ..ui import DefaultPaginator
 from ..checks import commands
 from ..log import Logger, log_exception
-from ..managers.locale import get_interaction_locale, get_localised_string
+from ..managers.locale import get_locale_context
 from ..responder import respond
 from ..subclasses import Cog
 from ..client import Client
@@ -88,12 +88,12 @@ class Core(Cog, name="core"):
     @allowed_installs(True, True)
     @commands.not_blacklisted()
     async def ping(self, interaction: Interaction) -> None:
-        locale = get_interaction_locale(interaction)
-        message = get_localised_string(locale, "core_ping_latency", latency=round(self.client.latency * 1000))
+        locale = get_locale_context(interaction)
+        message = locale.t("core_ping_latency", latency=round(self.client.latency * 1000))
         
         await respond(
             interaction,
-            title=get_localised_string(locale, "core_ping_msg"),
+            title=locale.t("core_ping_msg"),
             message=message
         )
 
@@ -107,9 +107,9 @@ class Core(Cog, name="core"):
     @commands.not_blacklisted()
     @commands.is_owner()
     async def shutdown(self, interaction: Interaction) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
-        await respond(interaction, message=get_localised_string(locale, "core_shutdown_msg"), hidden=True)
+        await respond(interaction, message=locale.t("core_shutdown_msg"), hidden=True)
         await self.client.stop()
 
     # /extensions list
@@ -122,17 +122,17 @@ class Core(Cog, name="core"):
     @commands.not_blacklisted()
     @commands.is_owner()
     async def _ext_list(self, interaction: Interaction) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         extensions = self.client.cogs
         message = "\n".join([f"`{ext}`" for ext in extensions.keys()])
         
         embed = Embed(
-            title=get_localised_string(locale, "core_ext_list_embed_title"),
+            title=locale.t("core_ext_list_embed_title"),
             colour=Colour.gold()
         )
         
-        embed.set_footer(text=get_localised_string(locale, "core_ext_list_embed_footer", count=len(extensions)))
+        embed.set_footer(text=locale.t("core_ext_list_embed_footer", count=len(extensions)))
         
         if len(extensions) > 15:
             chunks = text_to_chunks(message)
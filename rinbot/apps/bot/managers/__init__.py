@@ -3,5 +3,9 @@ from . import (
     locale,
     tasks,
     events,
-    extensions
+    extensions,
+    spam,
+    settings,
+    joins,
+    resolver
 )
@@ -1,5 +1,4 @@
 import os
-import time
 import asyncio
 import discord
 import platform
@@ -7,27 +6,20 @@ import wavelink
 import tempfile
 
 from discord.app_commands import Command, ContextMenu
-from discord import Interaction, VoiceState, Guild, Member, Message, Embed
-from discord import Forbidden
+from discord import Interaction, VoiceState, Guild, Member, Message
 from typing import TYPE_CHECKING
 from gtts import gTTS
 
-from ..helpers import hex_to_colour
-from ..utils import get_full_command, get_channel, get_user_avatar
+from ..utils import get_full_command
 from ..conf import conf
 from ..log import Logger, format_exception
 from ..subclasses import Cog
 from ..objects import TTSClient
-from ..models import WelcomeChannels, AutoRole, GuildConfig
 
 if TYPE_CHECKING:
     from ..client import Client
 
 logger = Logger.EVENTS
-user_message_times: dict[int, list[float]] = {}
-
-SPAM_TIME_WINDOW = conf.spam_filter.time_window
-SPAM_MAX_PER_WINDOW = conf.spam_filter.max_per_window
 
 
 async def play_tts(tts_client: TTSClient, text: str) -> None:
@@ -72,6 +64,9 @@ class EventHandler(Cog, name="event_handler"):
         # Update DB
         await self.client.db_manager.check_all()
         
+        # Cache guild settings
+        await self.client.guild_settings.load()
+        
         # Run tasks
         await self.client.task_handler.start()
         
@@ -122,12 +117,14 @@ class EventHandler(Cog, name="event_handler"):
     @Cog.listener()
     async def on_guild_join(self, guild: Guild) -> None:
         logger.info(f"Joined guild '{guild.name}' (ID: {guild.id})")
-        await self.client.db_manager.check_all()
+        await self.client.db_manager.sync_guild(guild)
+        await self.client.guild_settings.refresh(guild.id)
     
     @Cog.listener()
     async def on_guild_remove(self, guild: Guild) -> None:
         logger.info(f"Left guild '{guild.name}' (ID: {guild.id})")
-        await self.client.db_manager.check_all()
+        await self.client.db_manager.remove_guild(guild)
+        self.client.guild_settings.forget(guild.id)
 
     @Cog.listener()
     async def on_member_join(self, member: Member) -> None:
@@ -135,154 +132,59 @@ class EventHandler(Cog, name="event_handler"):
             f"Member {member.name} (ID: {member.id}) has joined guild {member.guild.name} (ID: {member.guild.id})"
         )
         
-        await self.client.db_manager.check_all()
-        
-        await self._on_member_join_action_welcome(member)
-        await self._on_member_join_action_role(member)
-
-    async def _on_member_join_action_welcome(self, member: Member) -> None:
-        logger.info(f"Performing welcome action for {member.display_name} (ID: {member.id})")
-        
-        guild = member.guild
-        welcome_data = await WelcomeChannels.objects.filter(guild_id=guild.id).afirst()
-        
-        if not welcome_data:
-            logger.info(f"No welcome channel setting found for {guild.name} (ID: {guild.id})")
-            return
-        
-        if not welcome_data.active or not welcome_data.channel_id:
-            logger.info(
-                f"Welcome channel setting is not active or channel ID is not set for {guild.name} (ID: {guild.id})"
-            )
-            return
-        
-        channel = await get_channel(self.client, welcome_data.channel_id)
-        
-        if not channel:
-            logger.error(f"Channel with ID {welcome_data.channel_id} not found in {guild.name} (ID: {guild.id})")
-            return
-        
-        title = welcome_data.title
-        description = welcome_data.description
-        
-        if "<username>" in title:
-            title = title.replace("<username>", member.display_name)
-        
-        embed = Embed(
-            title=title,
-            colour=hex_to_colour(welcome_data.colour)
-        )
-        
-        if description:
-            if "<username>" in description:
-                description = description.replace("<username>", member.display_name)
-            elif "<mention>" in description:
-                description = description.replace("<mention>", member.mention)
-            
-            embed.description = description
-        
-        user_pic = await get_user_avatar(member)
-        
-        if welcome_data.show_pfp == 1:
-            embed.set_thumbnail(url=user_pic)
-        
-        elif welcome_data.show_pfp == 2:
-            embed.set_image(url=user_pic)
-        
-        await channel.send(embed=embed)
-
-    async def _on_member_join_action_role(self, member: Member) -> None:
-        logger.info(f"Performing auto-role action for {member.display_name} (ID: {member.id})")
-        
-        guild = member.guild
-        me = guild.me
-        
-        auto_roles = await AutoRole.objects.filter(guild_id=guild.id).afirst()
-        
-        if not auto_roles:
-            logger.info(f"No auto-role setting found for {guild.name} (ID: {guild.id})")
-            return
-        
-        if not auto_roles.active or not auto_roles.role_id:
-            logger.info(f"Auto-role setting is not active or role ID is not set for {guild.name} (ID: {guild.id})")
-            return
-        
-        role = await guild.fetch_role(auto_roles.role_id)
-        
-        if not role:
-            logger.error(f"Role with ID {auto_roles.role_id} not found in {guild.name} (ID: {guild.id})")
-            return
-        
-        if role in member.roles:
-            logger.info(f"Role '{role.name}' is already assigned to {member.display_name} (ID: {member.id})")
-            return
-        
-        logger.info(f"Adding role '{role.name}' to {member.display_name} (ID: {member.id})")
-        
-        if not me.guild_permissions.manage_roles:
-            logger.warning(f"I do not have permission to manage roles in {guild.name} (ID: {guild.id})")
-            return
-        
-        try:
-            await member.add_roles(role)
-        
-        except Forbidden:
-            logger.warning(
-                f"I am unable to assign '{role.name}' to {member.display_name} (ID: {member.id}), " \
-                "role is probably higher than my highest role"
-            )
+        # Synced, welcomed and given the auto-role in batches, see JoinQueue
+        self.client.join_queue.push(member)
 
     @Cog.listener()
     async def on_member_remove(self, member: Member) -> None:
         logger.info(
             f"Member {member.name} (ID: {member.id}) has left guild {member.guild.name} (ID: {member.guild.id})"
         )
+        
+        await self.client.db_manager.remove_member(member)
 
-    async def _on_spam_action(self, message: Message) -> None:
+    async def _on_spam_action(self, message: Message, time_window: int) -> None:
         logger.warning(
             f"Spam detected from {message.author.display_name} (ID: {message.author.id}) " \
             f"in {message.guild.name} (ID: {message.guild.id})"
         )
         
         me = message.guild.me
-        guild_config = await GuildConfig.objects.filter(guild_id=message.guild.id).afirst()
+        guild_config = self.client.guild_settings.get_spam(message.guild.id)
         
         if not guild_config:
             logger.info(f"No spam filter setting found for {message.guild.name} (ID: {message.guild.id})")
             return
         
-        if guild_config.spam_filter_action == 0:
+        if guild_config.action == 0:
             logger.info(f"Spam filter is disabled for {message.guild.name} (ID: {message.guild.id})")
             return
         
-        if guild_config.spam_filter_action == 1:
+        if guild_config.action == 1:
             logger.info(
                 f"Spam filter action is set to delete messages for {message.guild.name} (ID: {message.guild.id})"
             )
             
             if me.guild_permissions.manage_messages:
                 logger.info(f"Deleting message from {message.author.display_name} (ID: {message.author.id})")
-                await message.delete()
-            
-            spam_filter_message = guild_config.spam_filter_message
-            
-            if spam_filter_message:
-                if "<username>" in spam_filter_message:
-                    spam_filter_message = spam_filter_message.replace("<username>", message.author.display_name)
-                elif "<mention>" in spam_filter_message:
-                    spam_filter_message = spam_filter_message.replace("<mention>", message.author.mention)
+                self.client.spam_cleaner.queue(message)
             
-                await message.channel.send(spam_filter_message)
+            if guild_config.message and self.client.spam_cleaner.once(
+                "notice", message.guild.id, message.author.id, time_window
+            ):
+                await message.channel.send(guild_config.message.render(message.author))
         
-        elif guild_config.spam_filter_action == 2:
+        elif guild_config.action == 2:
             logger.info(
                 f"Spam filter action is set to kick members for {message.guild.name} (ID: {message.guild.id})"
             )
             
             if me.guild_permissions.manage_messages:
-                await message.delete()
+                self.client.spam_cleaner.queue(message)
             
-            if me.guild_permissions.kick_members:
+            if me.guild_permissions.kick_members and self.client.spam_cleaner.once(
+                "kick", message.guild.id, message.author.id, time_window
+            ):
                 logger.info(f"Kicking {message.author.display_name} (ID: {message.author.id}) for spam")
                 await message.author.kick(reason="Spam")
     
@@ -312,21 +214,10 @@ class EventHandler(Cog, name="event_handler"):
         
         # Anti-spam
         if conf.spam_filter.enabled:
-            user_id = message.author.id
-            current_time = time.time()
-            
-            if user_id not in user_message_times:
-                user_message_times[user_id] = []
-            
-            user_message_times[user_id].append(current_time)
-            
-            user_message_times[user_id] = [
-                t for t in user_message_times[user_id] 
-                if current_time - t <= SPAM_TIME_WINDOW
-            ]
+            time_window, max_per_window = self.client.guild_settings.spam_thresholds(message.guild.id)
             
-            if len(user_message_times[user_id]) > SPAM_MAX_PER_WINDOW:
-                return await self._on_spam_action(message)
+            if self.client.spam_tracker.hit(message.guild.id, message.author.id, time_window, max_per_window):
+                return await self._on_spam_action(message, time_window)
         
         await self._on_message_tts(message)
 
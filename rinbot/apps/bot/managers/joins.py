@@ -0,0 +1,220 @@
+import asyncio
+
+from discord import Embed, Forbidden, HTTPException, Guild, Locale, Member, Role
+from typing import TYPE_CHECKING, Optional
+
+from .locale import get_localised_string
+from .settings import WelcomeSettings, AutoRoleSettings
+from ..utils import get_channel, get_role, get_user_avatar
+from ..log import Logger, format_exception
+
+if TYPE_CHECKING:
+    from ..client import Client
+
+logger = Logger.EVENTS
+
+
+class JoinQueue:
+    """
+    Per-guild pipeline for member joins
+
+    Joins are collected for window seconds after the first one reaches an idle guild,
+    then a single worker syncs them to the DB in one batch and sends the welcomes.
+    More than threshold joins in a window are welcomed with one collapsed message
+    instead of one embed each. Auto-role assignments go through their own worker,
+    one every role_interval seconds, so a raid doesn't pile hundreds of requests onto
+    the same rate-limit bucket
+    """
+
+    MAX_NAMES = 3  # Members named in a collapsed welcome
+
+    def __init__(self, client: "Client", window: float, threshold: int, role_interval: float) -> None:
+        self.client = client
+        self.window = window
+        self.threshold = threshold
+        self.role_interval = role_interval
+        self._joins: dict[int, list[Member]] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+        self._roles: dict[int, list[Member]] = {}
+        self._role_workers: dict[int, asyncio.Task] = {}
+
+    def push(self, member: Member) -> None:
+        """
+        Queues a member who joined for the next batch of their guild
+        """
+
+        guild_id = member.guild.id
+        self._joins.setdefault(guild_id, []).append(member)
+
+        if guild_id not in self._workers:
+            self._workers[guild_id] = asyncio.get_running_loop().create_task(self._run(guild_id))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "guilds": len(self._workers),
+            "joins": sum(len(members) for members in self._joins.values()),
+            "roles": sum(len(members) for members in self._roles.values())
+        }
+
+    async def _run(self, guild_id: int) -> None:
+        try:
+            await asyncio.sleep(self.window)
+
+        finally:
+            # Joins queued from here on start a new batch
+            self._workers.pop(guild_id, None)
+
+        members = self._joins.pop(guild_id, None)
+
+        if not members:
+            return
+
+        guild = members[0].guild
+
+        try:
+            await self.process(guild, members)
+
+        except Exception as e:
+            logger.error(f"Failed to process {len(members)} join(s) in {guild.name} (ID: {guild.id}): {format_exception(e)}")
+
+    async def process(self, guild: Guild, members: list[Member]) -> None:
+        """
+        Syncs, welcomes and queues the auto-role for a batch of members who joined a guild
+        """
+
+        # A member who left and rejoined inside the window is queued twice, the latest join wins.
+        # Members who left while queued were already removed by on_member_remove
+        latest = {member.id: member for member in members}
+        members = [member for member in latest.values() if guild.get_member(member.id) is not None]
+
+        if not members:
+            return
+
+        logger.info(f"Processing {len(members)} join(s) in {guild.name} (ID: {guild.id})")
+
+        if len(members) == 1:
+            await self.client.db_manager.sync_member(members[0])
+        else:
+            await self.client.db_manager.sync_members(guild, members)
+
+        settings = await self.client.guild_settings.get(guild.id)
+
+        if settings.welcome:
+            await self._welcome(guild, members, settings.welcome)
+
+        if settings.auto_role:
+            await self._queue_roles(guild, members, settings.auto_role)
+
+    async def _welcome(self, guild: Guild, members: list[Member], welcome_data: WelcomeSettings) -> None:
+        if not welcome_data.active or not welcome_data.channel_id:
+            logger.info(
+                f"Welcome channel setting is not active or channel ID is not set for {guild.name} (ID: {guild.id})"
+            )
+            return
+
+        channel = await get_channel(self.client, welcome_data.channel_id)
+
+        if not channel:
+            logger.error(f"Channel with ID {welcome_data.channel_id} not found in {guild.name} (ID: {guild.id})")
+            return
+
+        try:
+            if len(members) > self.threshold:
+                await channel.send(embed=self._burst_embed(guild, members, welcome_data))
+                return
+
+            for member in members:
+                await channel.send(embed=welcome_data.template.render(member, await get_user_avatar(member)))
+
+        except HTTPException as e:
+            logger.error(f"Failed to send welcome message in {guild.name} (ID: {guild.id}): {format_exception(e)}")
+
+    def _burst_embed(self, guild: Guild, members: list[Member], welcome_data: WelcomeSettings) -> Embed:
+        locale = guild.preferred_locale
+
+        if locale is None or locale == Locale.american_english:
+            locale = Locale.british_english
+
+        names = ", ".join(member.mention for member in members[:self.MAX_NAMES])
+        others = len(members) - self.MAX_NAMES
+
+        if others > 0:
+            description = get_localised_string(locale.value, "join_burst_welcome_others", names=names, others=others)
+        else:
+            description = get_localised_string(locale.value, "join_burst_welcome", names=names)
+
+        logger.info(f"Collapsed {len(members)} welcome(s) into one message in {guild.name} (ID: {guild.id})")
+
+        return Embed(description=description, colour=welcome_data.template.colour)
+
+    async def _queue_roles(self, guild: Guild, members: list[Member], auto_role: AutoRoleSettings) -> None:
+        if not auto_role.active or not auto_role.role_id:
+            logger.info(f"Auto-role setting is not active or role ID is not set for {guild.name} (ID: {guild.id})")
+            return
+
+        if not guild.me.guild_permissions.manage_roles:
+            logger.warning(f"I do not have permission to manage roles in {guild.name} (ID: {guild.id})")
+            return
+
+        self._roles.setdefault(guild.id, []).extend(members)
+
+        if guild.id not in self._role_workers:
+            self._role_workers[guild.id] = asyncio.get_running_loop().create_task(self._assign_roles(guild))
+
+    async def _assign_roles(self, guild: Guild) -> None:
+        role: Optional[Role] = None
+
+        try:
+            while members := self._roles.get(guild.id):
+                member = members.pop(0)
+
+                # Settings are re-read per member so toggling the feature off stops a running raid
+                auto_role = (await self.client.guild_settings.get(guild.id)).auto_role
+
+                if not auto_role or not auto_role.active or not auto_role.role_id:
+                    logger.info(f"Auto-role was turned off in {guild.name} (ID: {guild.id}), dropping {len(members) + 1} assignment(s)")
+                    break
+
+                if role is None or role.id != auto_role.role_id:
+                    role = await get_role(self.client, guild, auto_role.role_id)
+
+                if not role:
+                    logger.error(f"Role with ID {auto_role.role_id} not found in {guild.name} (ID: {guild.id})")
+                    break
+
+                if await self._assign_role(guild, member, role):
+                    await asyncio.sleep(self.role_interval)
+
+        finally:
+            self._roles.pop(guild.id, None)
+            self._role_workers.pop(guild.id, None)
+
+    @staticmethod
+    async def _assign_role(guild: Guild, member: Member, role: Role) -> bool:
+        """
+        Gives a member the auto-role, returns whether a request was made
+        """
+
+        if guild.get_member(member.id) is None:
+            logger.info(f"{member.display_name} (ID: {member.id}) left before getting the auto-role")
+            return False
+
+        if role in member.roles:
+            logger.info(f"Role '{role.name}' is already assigned to {member.display_name} (ID: {member.id})")
+            return False
+
+        logger.info(f"Adding role '{role.name}' to {member.display_name} (ID: {member.id})")
+
+        try:
+            await member.add_roles(role)
+
+        except Forbidden:
+            logger.warning(
+                f"I am unable to assign '{role.name}' to {member.display_name} (ID: {member.id}), " \
+                "role is probably higher than my highest role"
+            )
+
+        except HTTPException as e:
+            logger.error(f"Failed to assign '{role.name}' to {member.display_name} (ID: {member.id}): {format_exception(e)}")
+
+        return True
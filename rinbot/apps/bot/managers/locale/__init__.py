@@ -1,9 +1,13 @@
 from .manager import (
     get_locale,
     get_interaction_locale,
-    get_localised_string
+    get_locale_context,
+    get_localised_string,
+    LocaleContext
 )
 
+from .catalog import LocaleCatalog, get_catalog, reload_catalog
+from .template import LocaleTemplate
 from .translator import Translator
 
 LOCALE_MAPPING = {
@@ -0,0 +1,373 @@
+import os
+import threading
+
+from types import MappingProxyType
+from typing import Optional, Mapping, Any
+
+from ...objects import Localisation
+from ...log import Logger
+from ...paths import Path
+from ...conf import conf
+from ...cache import content_hash, read_cache, write_cache
+from ..files.yaml import read
+from .template import LocaleTemplate
+
+logger = Logger.LOCALE
+
+SECTIONS = [
+    "system",
+    "commands",
+    "responses"
+]
+
+CHECKED: dict[str, bool] = {}
+
+DEFAULT_LOCALE = "en-GB"
+
+
+def check_sections(locale_file: str, locale_data: dict) -> bool:
+    for section in SECTIONS:
+        if section not in locale_data:
+            logger.error(f"Section '{section}' not found in locale file")
+            return False
+
+        if not isinstance(locale_data[section], dict):
+            logger.error(f"Section '{section}' is not a dictionary")
+            return False
+
+    if locale_file not in CHECKED:
+        logger.debug(f"Locale file at '{locale_file}' is valid")
+
+    CHECKED[locale_file] = True
+
+    return True
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Turns lists into tuples so cached strings can't be mutated by callers
+    """
+
+    if isinstance(value, list):
+        return tuple(value)
+
+    return value
+
+
+Entry = LocaleTemplate | tuple[str, ...]
+
+
+class LocaleCatalog:
+    """
+    Immutable in-memory index of every locale file in Path.LOCALE
+
+    Every file is parsed once, validated with check_sections and flattened into a
+    read-only key -> template mapping so lookups never touch the disk
+
+    Lookups go through a merged index per locale code that already contains its
+    fallback chain (e.g. pt-BR -> pt -> en-GB), so a key missing from a locale is
+    served from the next one in the chain with a single dict lookup
+    """
+
+    def __init__(
+            self,
+            locales: dict[str, Localisation],
+            version: int = 1,
+            signature: tuple[tuple[str, int, int], ...] = (),
+            fallbacks: Optional[Mapping[str, list[str]]] = None
+    ) -> None:
+        self.version = version
+        self.signature = signature
+        self._fallbacks = conf.locale_fallbacks if fallbacks is None else fallbacks
+        self._locales = MappingProxyType(locales)
+        self._codes = frozenset(locales)
+        self._indexes: Mapping[str, Mapping[str, Entry]] = MappingProxyType({
+            code: self._build_index(code, localisation)
+            for code, localisation in locales.items()
+        })
+        self._chains: dict[str, tuple[str, ...]] = {}
+        self._merged: dict[str, Optional[Mapping[str, Entry]]] = {}
+
+        for key, per_locale in self.placeholder_report().items():
+            detail = " | ".join(f"{code}: {sorted(fields)}" for code, fields in per_locale.items())
+            logger.warning(f"Placeholders for '{key}' differ between locales: [{detail}]")
+
+        for code in (*self._locales, *self._fallbacks):
+            chain = self.chain(code)
+            index = self.index(code)
+
+            if index is not None and code in self._indexes:
+                borrowed = len(index) - len(self._indexes[code])
+
+                if borrowed:
+                    logger.debug(f"Locale '{code}' borrows {borrowed} string(s) from {' -> '.join(chain[1:])}")
+
+    @staticmethod
+    def _build_index(code: str, localisation: Localisation) -> Mapping[str, Entry]:
+        index: dict[str, Entry] = {}
+
+        # Reversed so that earlier sections win on duplicate keys, same as the old section walk
+        for section in reversed(SECTIONS):
+            for key, value in getattr(localisation, section).items():
+                if not isinstance(value, str):
+                    index[key] = value
+                    continue
+
+                try:
+                    index[key] = LocaleTemplate(key, value)
+
+                except ValueError as e:
+                    logger.error(f"String '{key}' in locale '{code}' is not a valid template, serving it as-is: {e}")
+                    index[key] = LocaleTemplate(key, value.replace("{", "{{").replace("}", "}}"))
+
+        return MappingProxyType(index)
+
+    def placeholder_report(self) -> dict[str, dict[str, frozenset[str]]]:
+        """
+        Lists every key whose placeholders aren't the same in all the locales that define it
+
+        Returns:
+            dict[str, dict[str, frozenset[str]]]: key -> {locale code: placeholder names}
+        """
+
+        fields: dict[str, dict[str, frozenset[str]]] = {}
+
+        for code, index in self._indexes.items():
+            for key, entry in index.items():
+                if isinstance(entry, LocaleTemplate):
+                    fields.setdefault(key, {})[code] = entry.fields
+
+        return {
+            key: per_locale
+            for key, per_locale in sorted(fields.items())
+            if len(set(per_locale.values())) > 1
+        }
+
+    def chain(self, locale: str) -> tuple[str, ...]:
+        """
+        Returns the loaded locales a code falls back through, most specific first
+        """
+
+        chain = self._chains.get(locale)
+
+        if chain is None:
+            candidates = [locale, *self._fallbacks.get(locale, []), locale.split("-", 1)[0], DEFAULT_LOCALE]
+            chain = tuple(dict.fromkeys(code for code in candidates if code in self._indexes))
+            self._chains[locale] = chain
+
+        return chain
+
+    def index(self, locale: str) -> Optional[Mapping[str, Entry]]:
+        """
+        Returns the merged index for a locale code with its fallback chain applied,
+        or None if no locale in the chain is loaded
+        """
+
+        try:
+            return self._merged[locale]
+
+        except KeyError:
+            pass
+
+        chain = self.chain(locale)
+
+        if not chain:
+            merged = None
+
+        elif len(chain) == 1:
+            merged = self._indexes[chain[0]]
+
+        else:
+            flat: dict[str, Entry] = {}
+
+            for code in reversed(chain):
+                flat.update(self._indexes[code])
+
+            merged = MappingProxyType(flat)
+
+        self._merged[locale] = merged
+
+        return merged
+
+    @classmethod
+    def load(
+            cls,
+            directory: str = Path.LOCALE,
+            version: int = 1,
+            strict: bool = False,
+            cache_path: Optional[str] = Path.LOCALE_CACHE
+    ) -> Optional["LocaleCatalog"]:
+        """
+        Parses and validates every locale file in a directory
+
+        The validated data is kept in a binary cache keyed by the content hash of the
+        locale files, so YAML is only parsed again when one of them changes
+
+        Args:
+            directory (str, optional): The locale directory. Defaults to Path.LOCALE
+            version (int, optional): The version number given to the catalog. Defaults to 1
+            strict (bool, optional): Return None if any file fails validation instead of skipping it. Defaults to False
+            cache_path (Optional[str], optional): The binary cache file, None to disable it. Defaults to Path.LOCALE_CACHE
+
+        Returns:
+            Optional[LocaleCatalog]: The catalog, or None if strict and a file is invalid
+        """
+
+        signature = locale_signature(directory)
+        paths = [os.path.join(directory, file) for file, _, _ in signature]
+
+        try:
+            digest = content_hash(paths)
+        except OSError:
+            digest = None
+
+        data = read_cache(cache_path, digest) if cache_path and digest else None
+
+        if data is not None:
+            logger.debug(f"Loaded locale data from binary cache at '{cache_path}'")
+        else:
+            data = cls._parse(paths, strict)
+
+            if data is None:
+                return None
+
+            if cache_path and digest and len(data) == len(paths):
+                write_cache(cache_path, digest, data)
+
+        locales = {
+            code: Localisation(**{
+                section: MappingProxyType({key: _freeze(value) for key, value in sections[section].items()})
+                for section in SECTIONS
+            })
+            for code, sections in data.items()
+        }
+
+        logger.info(f"Loaded {len(locales)} locale(s) as catalog v{version}: {', '.join(locales)}")
+
+        return cls(locales, version, signature)
+
+    @staticmethod
+    def _parse(paths: list[str], strict: bool) -> Optional[dict[str, dict[str, dict]]]:
+        data: dict[str, dict[str, dict]] = {}
+
+        for path in paths:
+            locale_data = read(path, silent=True)
+
+            if locale_data is None:
+                logger.error(f"Locale file at '{path}' is empty, invalid or doesn't exist")
+
+                if strict:
+                    return None
+
+                continue
+
+            if not check_sections(path, locale_data):
+                logger.error(f"Locale file at '{path}' is invalid, section check failed")
+
+                if strict:
+                    return None
+
+                continue
+
+            data[os.path.basename(path)[:-4]] = {section: locale_data[section] for section in SECTIONS}
+
+        return data
+
+    @property
+    def codes(self) -> frozenset[str]:
+        return self._codes
+
+    def get(self, locale: str) -> Optional[Localisation]:
+        return self._locales.get(locale)
+
+    def primary(self, locale: str) -> Optional[str]:
+        """
+        Returns the loaded locale that actually serves a code, the head of its chain
+        """
+
+        chain = self.chain(locale)
+
+        return chain[0] if chain else None
+
+
+def locale_signature(directory: str = Path.LOCALE) -> tuple[tuple[str, int, int], ...]:
+    """
+    Returns the (file, mtime, size) of every locale file, used to detect edits without reading them
+    """
+
+    signature = []
+
+    for file in sorted(os.listdir(directory)):
+        if not file.endswith(".yml"):
+            continue
+
+        try:
+            stat = os.stat(os.path.join(directory, file))
+
+        except FileNotFoundError:
+            continue
+
+        signature.append((file, stat.st_mtime_ns, stat.st_size))
+
+    return tuple(signature)
+
+
+_catalog: Optional[LocaleCatalog] = None
+_reload_lock = threading.Lock()
+_rejected_signature: Optional[tuple[tuple[str, int, int], ...]] = None
+
+
+def get_catalog() -> LocaleCatalog:
+    """
+    Returns the process-wide catalog, loading it on first use
+
+    Callers should fetch it once and keep the reference for the whole lookup, a reload
+    swaps in a new catalog instead of mutating the current one
+    """
+
+    global _catalog
+
+    if _catalog is None:
+        with _reload_lock:
+            if _catalog is None:
+                _catalog = LocaleCatalog.load()
+
+    return _catalog
+
+
+def reload_catalog(force: bool = False) -> bool:
+    """
+    Rebuilds the catalog if the locale files changed on disk and swaps it in
+
+    Blocking, run it in a thread from async code. The new catalog is only published
+    once every file parsed and passed check_sections, otherwise the current one stays
+
+    Args:
+        force (bool, optional): Rebuild even if no file changed. Defaults to False
+
+    Returns:
+        bool: True if a new catalog was swapped in
+    """
+
+    global _catalog, _rejected_signature
+
+    with _reload_lock:
+        current = _catalog
+        signature = locale_signature()
+
+        if not force and current is not None and signature in (current.signature, _rejected_signature):
+            return False
+
+        version = current.version + 1 if current else 1
+        catalog = LocaleCatalog.load(version=version, strict=True)
+
+        if catalog is None:
+            logger.error(f"Locale reload failed validation, keeping catalog v{current.version if current else 0}")
+            _rejected_signature = signature
+            return False
+
+        _catalog = catalog
+
+    logger.info(f"Swapped in locale catalog v{catalog.version}")
+
+    return True
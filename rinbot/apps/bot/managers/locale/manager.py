@@ -1,107 +1,142 @@
-import os
-
 from discord import Interaction, Locale
-from typing import Optional
+from typing import Optional, Mapping
 
 from ...objects import Localisation
 from ...log import Logger
-from ...paths import Path
-from ..files.yaml import read
+from .catalog import DEFAULT_LOCALE, Entry, LocaleCatalog, get_catalog
+from .template import LocaleTemplate
 
 logger = Logger.LOCALE
 
-SECTIONS = [
-    "system",
-    "commands",
-    "responses"
-]
-
-CHECKED: dict[str, bool] = {}
-INVALID_REPORTED_KEYS: dict[str, list[str]] = {}
-
-
-def check_sections(locale_file: str, locale_data: dict) -> bool:    
-    for section in SECTIONS:
-        if section not in locale_data:
-            logger.error(f"Section '{section}' not found in locale file")
-            return False
-        
-        if not isinstance(locale_data[section], dict):
-            logger.error(f"Section '{section}' is not a dictionary")
-            return False
-    
-    if locale_file not in CHECKED:
-        logger.debug(f"Locale file at '{locale_file}' is valid")
-    
-    CHECKED[locale_file] = True
-    
-    return True
+CONTEXT_KEY = "rinbot_locale_context"
 
+# Known misses per requested locale, so repeated lookups of a missing key are reported once
+INVALID_REPORTED_KEYS: dict[str, set[str]] = {}
+UNLOADED_REPORTED_LOCALES: set[str] = set()
+INVALID_FORMAT_REPORTED: set[tuple[str, str]] = set()
+
+
+class LocaleContext:
+    """
+    The locale of a single interaction, resolved once against one catalog version
+
+    Use t() for lookups, it goes straight to the pinned index without resolving the
+    interaction's locale or the catalog again
+    """
+
+    __slots__ = ("code", "catalog", "localisation", "_index")
+
+    def __init__(self, code: str, catalog: LocaleCatalog, index: Mapping[str, Entry]) -> None:
+        self.code = code
+        self.catalog = catalog
+        self.localisation: Optional[Localisation] = catalog.get(catalog.primary(code) or code)
+        self._index = index
+
+    def __repr__(self) -> str:
+        return f"<LocaleContext code={self.code!r} catalog=v{self.catalog.version}>"
+
+    def t(self, key: str, *args, **kwargs) -> Optional[str | tuple[str, ...]]:
+        return _render(self._index, self.code, key, *args, **kwargs)
+
+
+def _resolve_index(catalog: LocaleCatalog, locale: str) -> tuple[str, Optional[Mapping[str, Entry]]]:
+    index = catalog.index(locale)
+
+    if locale not in catalog.codes and locale not in UNLOADED_REPORTED_LOCALES:
+        UNLOADED_REPORTED_LOCALES.add(locale)
+        logger.warning(
+            f"Locale code '{locale}' not present in locale list, " \
+            f"falling back to '{catalog.primary(locale) or DEFAULT_LOCALE}'"
+        )
+
+    if index is None:
+        logger.error("Failed to load default locale")
+
+    return locale, index
+
+
+def _render(index: Mapping[str, Entry], locale: str, key: str, *args, **kwargs) -> Optional[str | tuple[str, ...]]:
+    entry = index.get(key)
+
+    if entry is None:
+        missing = INVALID_REPORTED_KEYS.setdefault(locale, set())
+
+        if key not in missing:
+            logger.error(f"Missing localised string '{key}' for locale '{locale}' and its fallbacks")
+            missing.add(key)
 
-def get_locale(locale: str | Locale) -> Optional[Localisation]:
-    base_locale_path = os.path.join(Path.LOCALE, f"{locale}.yml")
-    
-    if not os.path.exists(base_locale_path):
-        logger.error(f"Locale file at '{base_locale_path}' does not exist")
         return None
-    
-    locale_data = read(base_locale_path, silent=True)
 
-    if locale_data is None:
-        logger.error(f"Locale file at '{base_locale_path}' is empty, invalid or doesn't exist")
+    if not isinstance(entry, LocaleTemplate):
+        return entry
+
+    try:
+        return entry.format(*args, **kwargs)
+
+    except Exception as e:
+        # Templates that fall back to str.format can raise anything their fields do (e.g. "{user.name}")
+        if (locale, key) not in INVALID_FORMAT_REPORTED:
+            logger.error(
+                f"Incorrect formatting provided for string '{key}' in locale '{locale}': " \
+                f"[Error: {e!r} | Expects: {sorted(entry.fields)} | Got: {sorted(kwargs)}]"
+            )
+            INVALID_FORMAT_REPORTED.add((locale, key))
+
         return None
-    
-    if not check_sections(base_locale_path, locale_data):
-        logger.error(f"Locale file at '{base_locale_path}' is invalid, section check failed")
+
+
+def get_locale(locale: str | Locale) -> Optional[Localisation]:
+    if isinstance(locale, Locale):
+        locale = locale.value
+
+    localisation = get_catalog().get(locale)
+
+    if localisation is None:
+        logger.error(f"Locale '{locale}' is not loaded, its file is missing or invalid")
         return None
-    
-    return Localisation(**locale_data)
+
+    return localisation
 
 
-def get_interaction_locale(interaction: Interaction) -> Optional[Localisation]:
+def get_interaction_locale(interaction: Interaction) -> str:
     locale = interaction.locale if interaction.locale else Locale.british_english
-    
+
     if locale == Locale.american_english:
         locale = Locale.british_english
-    
+
     return locale.value
 
 
-def get_localised_string(locale: str, key: str, *args, **kwargs) -> Optional[str | list[str]]:
+def get_locale_context(interaction: Interaction) -> LocaleContext:
+    """
+    Returns the interaction's locale context, resolving and attaching it on first use
+
+    The context is stored in interaction.extras, the command tree attaches it as soon
+    as an interaction is dispatched so helpers and views only ever read it
+    """
+
+    extras = getattr(interaction, "extras", None)
+
+    if extras is not None and CONTEXT_KEY in extras:
+        return extras[CONTEXT_KEY]
+
+    catalog = get_catalog()
+    code, index = _resolve_index(catalog, get_interaction_locale(interaction))
+    context = LocaleContext(code, catalog, index or {})
+
+    if extras is not None:
+        extras[CONTEXT_KEY] = context
+
+    return context
+
+
+def get_localised_string(locale: str, key: str, *args, **kwargs) -> Optional[str | tuple[str, ...]]:
     if isinstance(locale, tuple):
         locale = locale[0]
-    
-    text = get_locale(locale)
-    
-    if not text:
-        logger.error(f"Locale code '{locale}' not present in locale list, defaulting to english")
-        text = get_locale("en-GB")
-    
-    if not text:
-        logger.error("Failed to load default locale")
-        return None
-    
-    for section in [text.system, text.commands, text.responses]:
-        if key in section:
-            string = section[key]
-            break
-    
-    else:        
-        if locale not in INVALID_REPORTED_KEYS:
-            INVALID_REPORTED_KEYS[locale] = []
-        
-        if key not in INVALID_REPORTED_KEYS[locale]:
-            logger.error(f"Missing localised string '{key}' for locale '{locale}'")
-            INVALID_REPORTED_KEYS[locale].append(key)
-        
-        return None
-    
-    if not isinstance(string, str):
-        return string
-    
-    try:
-        return string.format(*args, **kwargs)
-    
-    except Exception as e:
-        logger.error(f"Incorrect formatting provided for string '{key}'")
+
+    locale, index = _resolve_index(get_catalog(), locale)
+
+    if index is None:
         return None
+
+    return _render(index, locale, key, *args, **kwargs)
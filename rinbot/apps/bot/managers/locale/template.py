@@ -0,0 +1,75 @@
+from string import Formatter
+
+_FORMATTER = Formatter()
+
+
+class LocaleTemplate:
+    """
+    A localised string parsed once into literal chunks and placeholder names
+
+    Templates that only use plain named placeholders ("{name}") are rendered by
+    joining the pre-split chunks, anything fancier (positional fields, format specs,
+    conversions, attribute access) falls back to str.format on the source string
+
+    Raises:
+        ValueError: If the source string isn't a valid format string
+    """
+
+    __slots__ = ("key", "source", "fields", "_parts", "_simple", "_static")
+
+    def __init__(self, key: str, source: str) -> None:
+        self.key = key
+        self.source = source
+
+        parts: list[tuple[str, str]] = []
+        fields: set[str] = set()
+        simple = True
+        static = True
+
+        for literal, field, spec, conversion in _FORMATTER.parse(source):
+            if field is None:
+                parts.append((literal, ""))
+                continue
+
+            static = False
+            name = field.split(".", 1)[0].split("[", 1)[0]
+
+            if not name.isidentifier() or spec or conversion or name != field:
+                simple = False
+
+            fields.add(name)
+            parts.append((literal, name))
+
+        self.fields: frozenset[str] = frozenset(fields)
+        self._parts = tuple(parts)
+        self._simple = simple
+        self._static = "".join(literal for literal, _ in parts) if static else None
+
+    def __repr__(self) -> str:
+        return f"<LocaleTemplate key={self.key!r} fields={sorted(self.fields)}>"
+
+    def format(self, *args, **kwargs) -> str:
+        """
+        Renders the template
+
+        Raises:
+            KeyError: A named placeholder wasn't provided
+            IndexError: A positional placeholder wasn't provided
+            Exception: Whatever str.format raises for the fancier templates, e.g. AttributeError
+        """
+
+        if self._static is not None:
+            return self._static
+
+        if not self._simple or args:
+            return self.source.format(*args, **kwargs)
+
+        chunks = []
+
+        for literal, name in self._parts:
+            chunks.append(literal)
+
+            if name:
+                chunks.append(format(kwargs[name]))
+
+        return "".join(chunks)
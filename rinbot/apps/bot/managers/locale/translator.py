@@ -1,32 +1,95 @@
-import os
-
-from discord import Locale
-from typing import Optional
-
-from discord.app_commands import (
-    locale_str,
-    Translator as DiscordTranslator,
-    TranslationContextTypes
-)
-
-from .manager import get_localised_string
-from ...paths import Path
-
-SUPPORTED_LOCALES = os.listdir(Path.LOCALE)
-
-
-class Translator(DiscordTranslator):
-    async def translate(
-            self,
-            string: locale_str | str,
-            locale: Locale,
-            context: TranslationContextTypes
-    ) -> Optional[str]:
-        msg = string.message if string.message else string
-        
-        if (locale == Locale.american_english) or (locale.value not in SUPPORTED_LOCALES):
-            locale = Locale.british_english
-        
-        localised = get_localised_string(locale.value, msg)
-        
-        return localised if localised else None
+from discord import Locale
+from typing import Optional, Mapping
+from types import MappingProxyType
+
+from discord.app_commands import (
+    locale_str,
+    Translator as DiscordTranslator,
+    TranslationContextTypes
+)
+
+from .catalog import DEFAULT_LOCALE, LocaleCatalog, get_catalog
+from .manager import get_localised_string
+from .template import LocaleTemplate
+from ...log import Logger
+
+logger = Logger.LOCALE
+
+EMPTY_INDEX: Mapping[str, str] = MappingProxyType({})
+
+
+def resolve_locale(locale: Locale) -> str:
+    """
+    Maps a Discord locale to the code looked up in the catalog, which applies the fallback chain
+    """
+
+    if locale == Locale.american_english:
+        return DEFAULT_LOCALE
+
+    return locale.value
+
+
+def build_translation_table(catalog: LocaleCatalog) -> Mapping[str, Mapping[str, str]]:
+    """
+    Renders every placeholder-free string of the catalog once for every Discord locale
+
+    Locales that resolve to the same merged index share the same rendered mapping
+
+    Returns:
+        Mapping[str, Mapping[str, str]]: Discord locale code -> key -> translated string
+    """
+
+    rendered: dict[int, Mapping[str, str]] = {}
+    table: dict[str, Mapping[str, str]] = {}
+
+    for locale in Locale:
+        index = catalog.index(resolve_locale(locale)) or EMPTY_INDEX
+
+        if id(index) not in rendered:
+            strings: dict[str, str] = {}
+
+            for key, entry in index.items():
+                if isinstance(entry, LocaleTemplate) and not entry.fields:
+                    strings[key] = entry.format()
+
+            rendered[id(index)] = MappingProxyType(strings)
+
+        table[locale.value] = rendered[id(index)]
+
+    logger.debug(f"Built translation table for {len(table)} Discord locales from {len(rendered)} locale index(es)")
+
+    return MappingProxyType(table)
+
+
+class Translator(DiscordTranslator):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._version = 0
+        self._table: Mapping[str, Mapping[str, str]] = MappingProxyType({})
+
+    def _get_table(self) -> Mapping[str, Mapping[str, str]]:
+        catalog = get_catalog()
+
+        if catalog.version != self._version:
+            self._table = build_translation_table(catalog)
+            self._version = catalog.version
+
+        return self._table
+
+    async def translate(
+            self,
+            string: locale_str | str,
+            locale: Locale,
+            context: TranslationContextTypes
+    ) -> Optional[str]:
+        msg = string.message if string.message else string
+
+        strings = self._get_table().get(locale.value)
+        localised = strings.get(msg) if strings is not None else None
+
+        if localised is None:
+            # Not a plain string, let the regular lookup report it
+            localised = get_localised_string(resolve_locale(locale), msg)
+
+        return localised if isinstance(localised, str) and localised else None
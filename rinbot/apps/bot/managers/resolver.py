@@ -0,0 +1,109 @@
+import time
+import asyncio
+
+from discord import Forbidden, NotFound
+from typing import Awaitable, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# How long an id that came back NotFound / Forbidden isn't asked for again
+MISS_TTL = 300.0
+
+
+class Resolver:
+    """
+    Cache-first lookup of Discord objects with a negative cache for the misses
+
+    The gateway cache is always asked first, REST only on a miss. Ids that REST
+    answered with NotFound or Forbidden are remembered for miss_ttl seconds and
+    resolve to None without a request until then, a later cache hit still wins
+
+    Fetches are single-flight, concurrent lookups of the same key while its request
+    is in flight wait on that request instead of sending their own
+    """
+
+    def __init__(self, miss_ttl: float = MISS_TTL) -> None:
+        self.miss_ttl = miss_ttl
+        self._misses: dict[Hashable, float] = {}
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.fetches = 0
+        self.negative_hits = 0
+        self.coalesced = 0
+
+    async def resolve(
+            self,
+            key: Hashable,
+            cached: Callable[[], Optional[T]],
+            fetch: Callable[[], Awaitable[T]]
+    ) -> Optional[T]:
+        """
+        Returns an object from the cache, or from REST unless it's a remembered miss
+
+        Args:
+            key (Hashable): Identifies the object, e.g. ("role", guild_id, role_id)
+            cached (Callable[[], Optional[T]]): The gateway cache lookup
+            fetch (Callable[[], Awaitable[T]]): The REST request
+
+        Returns:
+            Optional[T]: The object, or None if it doesn't exist or can't be seen
+        """
+
+        value = cached()
+
+        if value is not None:
+            self.hits += 1
+            return value
+
+        now = time.monotonic()
+
+        if now < self._misses.get(key, 0.0):
+            self.negative_hits += 1
+            return None
+
+        flight = self._inflight.get(key)
+
+        if flight is not None:
+            self.coalesced += 1
+        else:
+            self.fetches += 1
+            flight = self._inflight[key] = asyncio.get_running_loop().create_task(self._fetch(key, fetch))
+
+        # Shielded so a cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(flight)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> Optional[T]:
+        try:
+            value = await fetch()
+
+        except (Forbidden, NotFound):
+            self._misses[key] = time.monotonic() + self.miss_ttl
+            return None
+
+        finally:
+            self._inflight.pop(key, None)
+
+        self._misses.pop(key, None)
+
+        return value
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drops expired misses, returns how many were dropped
+        """
+
+        now = time.monotonic() if now is None else now
+        before = len(self._misses)
+
+        self._misses = {key: until for key, until in self._misses.items() if now < until}
+
+        return before - len(self._misses)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "negative_hits": self.negative_hits,
+            "coalesced": self.coalesced,
+            "misses": len(self._misses)
+        }
@@ -0,0 +1,218 @@
+import asyncio
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ..conf import conf
+from ..log import Logger, format_exception
+from ..models import GuildConfig, WelcomeChannels, AutoRole
+from ..templates import PlaceholderTemplate, WelcomeTemplate
+
+logger = Logger.EVENTS
+
+
+@dataclass(frozen=True)
+class SpamSettings:
+    action: int
+    message: Optional[PlaceholderTemplate]
+    time_window: int
+    max_per_window: int
+
+    @classmethod
+    def from_model(cls, config: GuildConfig) -> "SpamSettings":
+        return cls(
+            action=config.spam_filter_action,
+            message=PlaceholderTemplate(config.spam_filter_message) if config.spam_filter_message else None,
+            time_window=config.spam_time_window or conf.spam_filter.time_window,
+            max_per_window=config.spam_max_per_window or conf.spam_filter.max_per_window
+        )
+
+
+@dataclass(frozen=True)
+class WelcomeSettings:
+    active: bool
+    channel_id: int
+    template: WelcomeTemplate
+
+    @classmethod
+    def from_model(cls, welcome_channel: WelcomeChannels) -> "WelcomeSettings":
+        colour = welcome_channel.colour
+
+        try:
+            template = WelcomeTemplate(welcome_channel.title, welcome_channel.description, colour, welcome_channel.show_pfp)
+
+        except ValueError:
+            # A bad row only loses its colour, it mustn't break loading every other guild
+            logger.error(
+                f"Invalid welcome colour '{colour}' for guild {welcome_channel.guild_id}, sending it without one"
+            )
+            template = WelcomeTemplate(welcome_channel.title, welcome_channel.description, None, welcome_channel.show_pfp)
+
+        return cls(
+            active=welcome_channel.active,
+            channel_id=welcome_channel.channel_id,
+            template=template
+        )
+
+
+@dataclass(frozen=True)
+class AutoRoleSettings:
+    active: bool
+    role_id: int
+
+    @classmethod
+    def from_model(cls, auto_role: AutoRole) -> "AutoRoleSettings":
+        return cls(active=auto_role.active, role_id=auto_role.role_id)
+
+
+@dataclass(frozen=True)
+class GuildSettings:
+    spam: Optional[SpamSettings] = None
+    welcome: Optional[WelcomeSettings] = None
+    auto_role: Optional[AutoRoleSettings] = None
+
+
+EMPTY_SETTINGS = GuildSettings()
+
+
+class GuildSettingsCache:
+    """
+    In-process copy of every guild's GuildConfig, WelcomeChannels and AutoRole rows,
+    so message and member events never query the DB
+
+    Everything is loaded once at startup, the config commands refresh a guild after
+    writing to it. get() loads a guild that isn't cached yet (e.g. joined after startup),
+    peek() is for the message path and never waits, a miss reads as "no settings" and
+    is fetched in the background. Guilds without any rows are cached as empty
+    """
+
+    def __init__(self) -> None:
+        self._guilds: dict[int, GuildSettings] = {}
+        self._pending: dict[int, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._guilds)
+
+    async def load(self) -> None:
+        logger.info("Loading guild settings")
+
+        spam: dict[int, SpamSettings] = {}
+        welcome: dict[int, WelcomeSettings] = {}
+        auto_role: dict[int, AutoRoleSettings] = {}
+
+        async for config in GuildConfig.objects.all():
+            spam[config.guild_id] = SpamSettings.from_model(config)
+
+        # Events only ever use a guild's first row, iterating backwards leaves that one in
+        async for welcome_channel in WelcomeChannels.objects.order_by('-pk'):
+            welcome[welcome_channel.guild_id] = WelcomeSettings.from_model(welcome_channel)
+
+        async for role in AutoRole.objects.order_by('-pk'):
+            auto_role[role.guild_id] = AutoRoleSettings.from_model(role)
+
+        self._guilds = {
+            guild_id: GuildSettings(spam.get(guild_id), welcome.get(guild_id), auto_role.get(guild_id))
+            for guild_id in spam.keys() | welcome.keys() | auto_role.keys()
+        }
+
+        logger.info(f"Loaded settings for {len(self._guilds)} guild(s)")
+
+    async def refresh(self, guild_id: int) -> GuildSettings:
+        """
+        Re-reads a guild's settings from the DB, call it after writing to any of them
+        """
+
+        config = await GuildConfig.objects.filter(guild_id=guild_id).afirst()
+        welcome_channel = await WelcomeChannels.objects.filter(guild_id=guild_id).order_by('pk').afirst()
+        auto_role = await AutoRole.objects.filter(guild_id=guild_id).order_by('pk').afirst()
+
+        settings = self._guilds[guild_id] = GuildSettings(
+            spam=SpamSettings.from_model(config) if config else None,
+            welcome=WelcomeSettings.from_model(welcome_channel) if welcome_channel else None,
+            auto_role=AutoRoleSettings.from_model(auto_role) if auto_role else None
+        )
+
+        return settings
+
+    def forget(self, guild_id: int) -> None:
+        """
+        Drops a guild the bot left without scheduling a refresh
+        """
+
+        self._guilds.pop(guild_id, None)
+
+    async def get(self, guild_id: int) -> GuildSettings:
+        """
+        Returns a guild's settings, loading them from the DB on a miss
+        """
+
+        settings = self._guilds.get(guild_id)
+
+        if settings is not None:
+            self.hits += 1
+            return settings
+
+        self.misses += 1
+
+        return await self.refresh(guild_id)
+
+    def peek(self, guild_id: int) -> GuildSettings:
+        """
+        Returns a guild's settings without waiting, empty on a miss while they load in the background
+        """
+
+        settings = self._guilds.get(guild_id)
+
+        if settings is not None:
+            self.hits += 1
+            return settings
+
+        self.misses += 1
+        self._schedule_refresh(guild_id)
+
+        return EMPTY_SETTINGS
+
+    def get_spam(self, guild_id: int) -> Optional[SpamSettings]:
+        return self.peek(guild_id).spam
+
+    def spam_thresholds(self, guild_id: int) -> tuple[int, int]:
+        """
+        Returns the guild's (time window, max messages per window), the global ones if unset
+        """
+
+        # Counted like any other lookup, this runs on every message
+        settings = self.peek(guild_id).spam
+
+        if settings is None:
+            return conf.spam_filter.time_window, conf.spam_filter.max_per_window
+
+        return settings.time_window, settings.max_per_window
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "guilds": len(self._guilds),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _schedule_refresh(self, guild_id: int) -> None:
+        if guild_id in self._pending:
+            return
+
+        async def _refresh() -> None:
+            try:
+                await self.refresh(guild_id)
+
+            except Exception as e:
+                logger.error(f"Failed to refresh settings for guild {guild_id}: {format_exception(e)}")
+
+            finally:
+                self._pending.pop(guild_id, None)
+
+        try:
+            self._pending[guild_id] = asyncio.get_running_loop().create_task(_refresh())
+
+        except RuntimeError:
+            pass
@@ -0,0 +1,225 @@
+import sys
+import time
+import asyncio
+
+from collections import deque
+from discord import Message, HTTPException
+from typing import Optional
+
+from ..log import Logger, format_exception
+
+logger = Logger.EVENTS
+
+
+class SpamTracker:
+    """
+    Sliding-window message counter per (guild, user)
+
+    Each author gets a deque capped at max_per_window + 1 timestamps, which is all
+    that's needed to tell whether the limit was crossed inside the window, so a check
+    is amortized O(1) and an author never holds more than that many entries. Authors
+    that went quiet for a whole window are dropped by sweep()
+
+    Guilds can use their own window and limit by passing them to hit(), the ones
+    given to the constructor are the defaults
+    """
+
+    def __init__(self, time_window: float, max_per_window: int) -> None:
+        self.time_window = time_window
+        self.max_per_window = max_per_window
+        self._entries: dict[tuple[int, int], deque[float]] = {}
+        self._windows: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def hit(
+            self,
+            guild_id: int,
+            user_id: int,
+            time_window: Optional[float] = None,
+            max_per_window: Optional[int] = None,
+            now: Optional[float] = None
+    ) -> bool:
+        """
+        Records a message and tells if its author is over the limit
+
+        Args:
+            guild_id (int): The guild the message was sent in
+            user_id (int): The author
+            time_window (Optional[float], optional): The guild's window in seconds. Defaults to the tracker's
+            max_per_window (Optional[int], optional): The guild's limit. Defaults to the tracker's
+            now (Optional[float], optional): A monotonic timestamp. Defaults to time.monotonic()
+
+        Returns:
+            bool: True if the author sent more than max_per_window messages inside the window
+        """
+
+        now = time.monotonic() if now is None else now
+        time_window = self.time_window if time_window is None else time_window
+        max_per_window = self.max_per_window if max_per_window is None else max_per_window
+
+        if time_window != self.time_window:
+            self._windows[guild_id] = time_window
+        else:
+            self._windows.pop(guild_id, None)
+
+        key = (guild_id, user_id)
+        times = self._entries.get(key)
+
+        if times is None or times.maxlen != max_per_window + 1:
+            times = self._entries[key] = deque(times or (), maxlen=max_per_window + 1)
+
+        times.append(now)
+
+        while now - times[0] > time_window:
+            times.popleft()
+
+        return len(times) > max_per_window
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Drops every author whose last message is older than the window
+
+        Returns:
+            int: How many authors were dropped
+        """
+
+        now = time.monotonic() if now is None else now
+        before = len(self._entries)
+        windows = self._windows
+
+        # Rebuilt rather than deleted from so the dict's table shrinks back after a raid
+        self._entries = {
+            key: times
+            for key, times in self._entries.items()
+            if now - times[-1] <= windows.get(key[0], self.time_window)
+        }
+
+        return before - len(self._entries)
+
+    def memory_footprint(self) -> int:
+        """
+        Approximate size in bytes of the tracked state, keys and timestamps included
+        """
+
+        size = sys.getsizeof(self._entries)
+
+        for key, times in self._entries.items():
+            size += sys.getsizeof(key) + sys.getsizeof(times) + sum(sys.getsizeof(t) for t in times)
+
+        return size
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "timestamps": sum(len(times) for times in self._entries.values()),
+            "bytes": self.memory_footprint()
+        }
+
+
+class SpamCleaner:
+    """
+    Batches spam deletions per channel and rate-limits the follow-up actions
+
+    Queued messages are deleted flush_interval seconds after the first one reaches
+    an idle channel, 100 at a time through the bulk-delete endpoint, so a raid costs
+    one REST call per channel per flush instead of one per message. once() lets the
+    caller post the spam notice (or kick) only once per author per window
+    """
+
+    MAX_BULK = 100  # Discord's bulk-delete limit
+
+    def __init__(self, flush_interval: float) -> None:
+        self.flush_interval = flush_interval
+        self._queues: dict[int, list[Message]] = {}
+        self._flushes: dict[int, asyncio.Task] = {}
+        self._until: dict[tuple[str, int, int], float] = {}
+
+    def queue(self, message: Message) -> None:
+        """
+        Queues a message for deletion on the next flush of its channel
+        """
+
+        channel_id = message.channel.id
+        self._queues.setdefault(channel_id, []).append(message)
+
+        if channel_id not in self._flushes:
+            self._flushes[channel_id] = asyncio.get_running_loop().create_task(self._flush_later(channel_id))
+
+    def once(self, action: str, guild_id: int, user_id: int, time_window: float, now: Optional[float] = None) -> bool:
+        """
+        Tells if an action should run for an author, at most once per window
+
+        Args:
+            action (str): What is being rate-limited, e.g. "notice" or "kick"
+            guild_id (int): The guild the spam was sent in
+            user_id (int): The author
+            time_window (float): The guild's spam window in seconds
+            now (Optional[float], optional): A monotonic timestamp. Defaults to time.monotonic()
+
+        Returns:
+            bool: True if the action didn't run for this author inside the window
+        """
+
+        now = time.monotonic() if now is None else now
+        key = (action, guild_id, user_id)
+
+        if now < self._until.get(key, 0.0):
+            return False
+
+        self._until[key] = now + time_window
+
+        return True
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Forgets actions whose window is over, returns how many were dropped
+        """
+
+        now = time.monotonic() if now is None else now
+        before = len(self._until)
+
+        self._until = {key: until for key, until in self._until.items() if now < until}
+
+        return before - len(self._until)
+
+    async def flush(self, channel_id: int) -> int:
+        """
+        Deletes everything queued for a channel
+
+        Returns:
+            int: How many messages were deleted
+        """
+
+        messages = self._queues.pop(channel_id, None)
+
+        if not messages:
+            return 0
+
+        channel = messages[0].channel
+        deleted = 0
+
+        for i in range(0, len(messages), self.MAX_BULK):
+            chunk = messages[i:i + self.MAX_BULK]
+
+            try:
+                await channel.delete_messages(chunk, reason="Spam")
+                deleted += len(chunk)
+
+            except HTTPException as e:
+                logger.error(f"Failed to delete {len(chunk)} spam message(s) in channel {channel_id}: {format_exception(e)}")
+
+        logger.info(f"Deleted {deleted} spam message(s) in channel {channel_id}")
+
+        return deleted
+
+    async def _flush_later(self, channel_id: int) -> None:
+        try:
+            await asyncio.sleep(self.flush_interval)
+
+        finally:
+            # Messages queued from here on start a new batch
+            self._flushes.pop(channel_id, None)
+
+        await self.flush(channel_id)
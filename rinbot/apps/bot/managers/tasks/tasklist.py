@@ -1,4 +1,5 @@
 import random
+import asyncio
 import datetime
 
 from discord.ext import tasks
@@ -9,7 +10,7 @@ from django.utils.timezone import now
 from ...log import Logger
 from ...conf import conf
 from ...utils import get_user
-from ..locale import get_locale, get_localised_string
+from ..locale import get_locale, get_localised_string, reload_catalog
 from ...models import Birthdays, UserConfig
 
 if TYPE_CHECKING:
@@ -45,37 +46,73 @@ class TaskList:
         
         await self.client.change_presence(activity=CustomActivity(name=status))
     
+    @tasks.loop(seconds=5)
+    async def locale_reload(self) -> None:
+        # Polls the locale files' mtimes and rebuilds the catalog off the event loop when they change
+        await asyncio.to_thread(reload_catalog)
+    
+    @tasks.loop(seconds=conf.spam_filter.time_window)
+    async def spam_sweep(self) -> None:
+        dropped = self.client.spam_tracker.sweep()
+        self.client.spam_cleaner.sweep()
+        
+        if dropped and conf.debug:
+            stats = self.client.spam_tracker.stats()
+            
+            logger.debug(
+                f"Spam tracker dropped {dropped} idle author(s): " \
+                f"[Entries: {stats['entries']} | Timestamps: {stats['timestamps']} | Bytes: {stats['bytes']}]"
+            )
+    
+    @tasks.loop(minutes=1)
+    async def cache_maintenance(self) -> None:
+        dropped = self.client.resolver.sweep()
+        
+        if conf.debug:
+            stats = self.client.resolver.stats()
+            
+            logger.debug(
+                f"Resolver: [Hits: {stats['hits']} | Fetches: {stats['fetches']} | " \
+                f"Negative hits: {stats['negative_hits']} | Coalesced: {stats['coalesced']} | " \
+                f"Misses: {stats['misses']} | Expired: {dropped}]"
+            )
+            
+            stats = self.client.guild_settings.stats()
+            
+            logger.debug(
+                f"Guild settings cache: [Guilds: {stats['guilds']} | Hits: {stats['hits']} | Misses: {stats['misses']}]"
+            )
+    
     @tasks.loop(time=datetime.time(hour=0, minute=0))
     async def birthday_check(self) -> None:
         today = now().date()
-        today_month_day = (today.month, today.day)
         
-        async for birthday in Birthdays.objects.all():
-            if (birthday.month, birthday.day) == today_month_day:
-                user = await get_user(self.client, birthday.user_id)
-                user_config = await UserConfig.objects.aget(user_id=birthday.user_id)
-                
-                if user and user_config.birthday_notifications:
-                    try:
-                        locale = birthday.user_locale
-                        title = get_localised_string(locale, "birthday_title")
-                        description = get_localised_string(locale, "birthday_description", name=birthday.name)
-                        
-                        if not title or not description:
-                            logger.error(f"Failed to get localised birthday strings for locale '{locale}'")
-                            continue
-                        
-                        embed = Embed(
-                            title=title,
-                            description=description,
-                            colour=Colour.gold()
-                        )
-                        
-                        await user.send(embed=embed)
-                        logger.info(f"Sent birthday message to {user.name} (ID: {user.id})")
+        # Served by the (day, month, user_id) unique index
+        async for birthday in Birthdays.objects.filter(month=today.month, day=today.day):
+            user = await get_user(self.client, birthday.user_id)
+            user_config = await UserConfig.objects.aget(user_id=birthday.user_id)
+            
+            if user and user_config.birthday_notifications:
+                try:
+                    locale = birthday.user_locale
+                    title = get_localised_string(locale, "birthday_title")
+                    description = get_localised_string(locale, "birthday_description", name=birthday.name)
+                    
+                    if not title or not description:
+                        logger.error(f"Failed to get localised birthday strings for locale '{locale}'")
+                        continue
+                    
+                    embed = Embed(
+                        title=title,
+                        description=description,
+                        colour=Colour.gold()
+                    )
                     
-                    except Exception as e:
-                        logger.error(f"Failed to send birthday message to user {birthday.user_id}: {e}")
+                    await user.send(embed=embed)
+                    logger.info(f"Sent birthday message to {user.name} (ID: {user.id})")
                 
-                else:
-                    logger.warning(f"Could not find user with ID {birthday.user_id} for birthday notification")
+                except Exception as e:
+                    logger.error(f"Failed to send birthday message to user {birthday.user_id}: {e}")
+            
+            else:
+                logger.warning(f"Could not find user with ID {birthday.user_id} for birthday notification")
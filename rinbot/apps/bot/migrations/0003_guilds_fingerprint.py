@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0002_guildconfig_spam_thresholds'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guilds',
+            name='fingerprint',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='guilds',
+            name='last_seen',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
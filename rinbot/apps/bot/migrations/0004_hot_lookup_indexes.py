@@ -0,0 +1,25 @@
+# Generated by Django 5.2 on 2026-10-18 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0003_guilds_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='admins',
+            index=models.Index(fields=['guild_id', 'user_id'], name='admins_guild_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='birthdays',
+            index=models.Index(fields=['user_id'], name='birthdays_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blacklist',
+            index=models.Index(fields=['user_id'], name='blacklist_user_idx'),
+        ),
+    ]
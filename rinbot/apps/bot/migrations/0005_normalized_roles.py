@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-18 19:10
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+def reset_fingerprints(apps, schema_editor):
+    # role_ids starts out empty, make the next startup resync every guild's members
+    apps.get_model('bot', 'Guilds').objects.update(fingerprint=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0004_hot_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuildRoles',
+            fields=[
+                ('role_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('guild_id', models.BigIntegerField()),
+                ('role_name', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Guild Role',
+                'verbose_name_plural': 'Guild Roles',
+            },
+        ),
+        migrations.RemoveField(
+            model_name='users',
+            name='roles',
+        ),
+        migrations.AddField(
+            model_name='users',
+            name='role_ids',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), blank=True, default=list, size=None),
+        ),
+        migrations.AddIndex(
+            model_name='users',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['role_ids'], name='users_role_ids_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='guildroles',
+            index=models.Index(fields=['guild_id'], name='guild_roles_guild_idx'),
+        ),
+        migrations.RunPython(reset_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-18 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0005_normalized_roles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='guilds',
+            name='digest',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='users',
+            name='digest',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+    ]
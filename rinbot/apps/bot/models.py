@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 
 
 class Admins(models.Model):
@@ -10,6 +11,9 @@ class Admins(models.Model):
     user_name = models.CharField(max_length=100)
 
     class Meta:
+        indexes = [
+            models.Index(fields=['guild_id', 'user_id'], name='admins_guild_user_idx')
+        ]
         verbose_name = "Admin"
         verbose_name_plural = "Admins"
     
@@ -43,6 +47,9 @@ class Birthdays(models.Model):
     
     class Meta:
         unique_together = ('day', 'month', 'user_id')
+        indexes = [
+            models.Index(fields=['user_id'], name='birthdays_user_idx')
+        ]
         verbose_name = "Birthday"
         verbose_name_plural = "Birthdays"
 
@@ -58,6 +65,9 @@ class Blacklist(models.Model):
 
     class Meta:
         unique_together = ('guild_id', 'user_id')
+        indexes = [
+            models.Index(fields=['user_id'], name='blacklist_user_idx')  # not_blacklisted() filters by user only
+        ]
 
     def __str__(self):
         return f"{self.user_name or self.user_id} in {self.guild_name or self.guild_id}"
@@ -91,10 +101,29 @@ class FavouritePlaylists(models.Model):
         return self.title or self.url
 
 
+class GuildRoles(models.Model):
+    role_id = models.BigIntegerField(primary_key=True)
+    guild_id = models.BigIntegerField()
+    role_name = models.CharField(max_length=100)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['guild_id'], name='guild_roles_guild_idx')
+        ]
+        verbose_name = "Guild Role"
+        verbose_name_plural = "Guild Roles"
+
+    def __str__(self):
+        return self.role_name
+
+
 class Guilds(models.Model):
     guild_id = models.BigIntegerField(primary_key=True)
     guild_name = models.CharField(max_length=100)
     user_count = models.IntegerField()
+    digest = models.CharField(max_length=32, null=True, blank=True)  # See checks.db.snapshot_digest
+    fingerprint = models.CharField(max_length=64, null=True, blank=True)  # See checks.db.guild_fingerprint
+    last_seen = models.DateTimeField(null=True, blank=True)  # Last full reconciliation
 
     class Meta:
         verbose_name = "Guild"
@@ -122,6 +151,16 @@ class GuildConfig(models.Model):
         choices=SPAM_FILTER_CHOICES,
         validators=[MinValueValidator(0), MaxValueValidator(2)]
     )
+    spam_time_window = models.IntegerField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(1), MaxValueValidator(300)]
+    )  # Seconds, falls back to the global spam-filter config when null
+    spam_max_per_window = models.IntegerField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(1), MaxValueValidator(100)]
+    )
     
     class Meta:
         verbose_name = "Guild Configuration"
@@ -150,10 +189,14 @@ class Users(models.Model):
     user_name = models.CharField(max_length=100)
     global_name = models.CharField(max_length=100)
     display_name = models.CharField(max_length=100)
-    roles = ArrayField(models.CharField(max_length=100))
+    role_ids = ArrayField(models.BigIntegerField(), default=list, blank=True)  # Names live in GuildRoles
+    digest = models.CharField(max_length=32, null=True, blank=True)  # See checks.db.snapshot_digest
 
     class Meta:
         unique_together = ('guild_id', 'user_id')
+        indexes = [
+            GinIndex(fields=['role_ids'], name='users_role_ids_gin')  # role_ids__contains=[...]
+        ]
         verbose_name = "User"
         verbose_name_plural = "Users"
 
@@ -1,6 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Mapping
 from discord import TextChannel, VoiceClient
 from discord.app_commands import Choice, locale_str
 
@@ -11,11 +11,11 @@ class Response(Enum):
     CHANNEL = 3
 
 
-@dataclass
+@dataclass(frozen=True)
 class Localisation:
-    system: dict[str, str | list[str]]
-    commands: dict[str, str | list[str]]
-    responses: dict[str, str | list[str]]
+    system: Mapping[str, str | tuple[str, ...]]
+    commands: Mapping[str, str | tuple[str, ...]]
+    responses: Mapping[str, str | tuple[str, ...]]
 
 
 @dataclass
@@ -42,6 +42,14 @@ class TTSClient:
     blame: bool
 
 
+@dataclass(frozen=True)
+class CheckResult:
+    name: str
+    duration: float
+    rows: int
+    ok: bool
+
+
 class CommandOptions:
     YES = [Choice(name=locale_str("state_yes"), value=1)]
     NO = [Choice(name=locale_str("state_no"), value=0)]
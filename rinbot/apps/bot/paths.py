@@ -17,6 +17,8 @@ class Path(StrEnum):
     LOG_TRACEBACKS = get_os_path("/var/lib/rinbot/logs/tracebacks", from_root=True)
     CACHE = get_os_path("/var/lib/rinbot/cache", from_root=True)
     TREE_HASH = get_os_path("/var/lib/rinbot/cache/tree_hash.txt", from_root=True)
+    LOCALE_CACHE = get_os_path("/var/lib/rinbot/cache/locale.bin", from_root=True)
+    CONFIG_CACHE = get_os_path("/var/lib/rinbot/cache/config.bin", from_root=True)
 
     @classmethod
     def list_paths(cls) -> list[str]:
@@ -2,7 +2,7 @@ from discord import Interaction, Colour, Embed
 from discord.ext.commands import Cog as DiscordCog
 from typing import Optional
 
-from .managers.locale import get_interaction_locale, get_localised_string
+from .managers.locale import get_locale_context
 from .utils import get_full_command
 from .log import Logger
 from .responder import respond
@@ -21,11 +21,11 @@ class Cog(DiscordCog):
             *args,
             **kwargs
     ) -> Response:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         await respond(
             interaction,
-            message=get_localised_string(locale, key, *args, **kwargs),
+            message=locale.t(key, *args, **kwargs),
             hidden=hidden
         )
     
@@ -37,8 +37,8 @@ class Cog(DiscordCog):
             response_type: Response = Response.SEND,
             *args, **kwargs
     ) -> None:
-        locale = get_interaction_locale(interaction)
-        string = get_localised_string(locale, key, *args, **kwargs)
+        locale = get_locale_context(interaction)
+        string = locale.t(key, *args, **kwargs)
         
         author = interaction.user
         
@@ -55,31 +55,31 @@ class Cog(DiscordCog):
     
     @staticmethod
     async def respond_with_success(interaction: Interaction, key: str, hidden: bool = False, *args, **kwargs) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         await respond(
             interaction, Colour.green(),
-            get_localised_string(locale, key, *args, **kwargs),
+            locale.t(key, *args, **kwargs),
             hidden=hidden
         )
     
     @staticmethod
     async def respond_with_failure(interaction: Interaction, key: str, hidden: bool = False, *args, **kwargs) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         await respond(
             interaction, Colour.red(),
-            get_localised_string(locale, key, *args, **kwargs),
+            locale.t(key, *args, **kwargs),
             hidden=hidden
         )
     
     @staticmethod
     async def respond_with_unknown_failure(interaction: Interaction) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         await respond(
             interaction, Colour.red(),
-            get_localised_string(locale, "error_unknown"),
+            locale.t("error_unknown"),
             hidden=True
         )
     
@@ -89,22 +89,22 @@ class Cog(DiscordCog):
             arguments: str,
             response_type: Optional[Response] = Response.SEND
     ) -> None:
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         command = get_full_command(interaction)
         
         logger.info(f"Responding with invalid args for interaction: [Command: {command} | Args.: '{arguments}']")
         
         await respond(
             interaction, Colour.red(),
-            get_localised_string(locale, "invalid_arguments", arguments=arguments),
+            locale.t("invalid_arguments", arguments=arguments),
             hidden=True,
             resp_type=response_type
         )
 
     @staticmethod
     async def respond_with_timeout(interaction: Interaction) -> None:
-        locale = get_interaction_locale(interaction)
-        message = get_localised_string(locale, "error_timeout")
+        locale = get_locale_context(interaction)
+        message = locale.t("error_timeout")
         
         await interaction.edit_original_response(
             content=None,
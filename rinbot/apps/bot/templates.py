@@ -0,0 +1,67 @@
+import re
+
+from typing import Optional
+from discord import Embed, Member, User
+
+from .helpers import hex_to_colour
+
+PLACEHOLDER_PATTERN = re.compile(r"<(username|mention)>")
+
+
+class PlaceholderTemplate:
+    """
+    A guild-written message with <username> and <mention> placeholders
+
+    The text is split around its placeholders once, rendering fills every one of them
+    in a single join
+    """
+
+    __slots__ = ("source", "_parts")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+        # Literal text at even indexes, placeholder names at odd ones
+        self._parts = tuple(PLACEHOLDER_PATTERN.split(source))
+
+    def __repr__(self) -> str:
+        return f"<PlaceholderTemplate source={self.source!r}>"
+
+    def render(self, user: Member | User) -> str:
+        if len(self._parts) == 1:
+            return self.source
+
+        values = {"username": user.display_name, "mention": user.mention}
+        parts = list(self._parts)
+        parts[1::2] = [values[name] for name in parts[1::2]]
+
+        return "".join(parts)
+
+
+class WelcomeTemplate:
+    """
+    A guild's welcome embed with its colour parsed and its texts compiled
+    """
+
+    __slots__ = ("title", "description", "colour", "show_pfp")
+
+    def __init__(self, title: Optional[str], description: Optional[str], colour: Optional[str], show_pfp: int) -> None:
+        self.title = PlaceholderTemplate(title) if title else None
+        self.description = PlaceholderTemplate(description) if description else None
+        self.colour = hex_to_colour(colour) if colour else None  # Raises ValueError on a malformed colour
+        self.show_pfp = show_pfp
+
+    def render(self, user: Member | User, avatar_url: str) -> Embed:
+        embed = Embed(
+            title=self.title.render(user) if self.title else None,
+            description=self.description.render(user) if self.description else None,
+            colour=self.colour
+        )
+
+        if self.show_pfp == 1:
+            embed.set_thumbnail(url=avatar_url)
+
+        elif self.show_pfp == 2:
+            embed.set_image(url=avatar_url)
+
+        return embed
@@ -0,0 +1,145 @@
+import os
+import random
+
+from unittest import skipUnless
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from ..models import (
+    Admins,
+    AutoRole,
+    Birthdays,
+    Blacklist,
+    Guilds,
+    GuildConfig,
+    WelcomeChannels
+)
+
+# EXPLAIN output is Postgres specific, and without a configured database there's nothing to connect to
+POSTGRES_CONFIGURED = bool(os.getenv('POSTGRES_DATABASE'))
+
+# Rough production volumes, enough for the planner to prefer an index over a scan
+GUILDS = 2000
+BLACKLISTED = 20000
+BIRTHDAYS = 50000
+ADMINS = 10000
+
+INDEX_SCANS = ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+
+
+@skipUnless(POSTGRES_CONFIGURED, "Needs a Postgres database (POSTGRES_DATABASE)")
+class HotLookupIndexTests(TestCase):
+    """
+    Asserts through EXPLAIN that every hot lookup is served by an index
+    """
+
+    databases = {'default'} if POSTGRES_CONFIGURED else set()
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        rng = random.Random(1)
+
+        guild_ids = [10 ** 17 + i for i in range(GUILDS)]
+        user_ids = [2 * 10 ** 17 + i for i in range(BIRTHDAYS)]
+
+        Guilds.objects.bulk_create(
+            [Guilds(guild_id=guild_id, guild_name=f"guild {guild_id}", user_count=0) for guild_id in guild_ids]
+        )
+
+        GuildConfig.objects.bulk_create(
+            [GuildConfig(guild_id=guild_id, spam_filter_action=0) for guild_id in guild_ids]
+        )
+
+        Blacklist.objects.bulk_create(
+            [Blacklist(guild_id=rng.choice(guild_ids), user_id=user_id) for user_id in user_ids[:BLACKLISTED]],
+            ignore_conflicts=True
+        )
+
+        Birthdays.objects.bulk_create(
+            [
+                Birthdays(
+                    day=rng.randint(1, 28),
+                    month=rng.randint(1, 12),
+                    name=f"user {user_id}",
+                    user_id=user_id,
+                    user_name=f"user {user_id}",
+                    user_locale="en-GB"
+                )
+                for user_id in user_ids
+            ],
+            ignore_conflicts=True
+        )
+
+        Admins.objects.bulk_create(
+            [
+                Admins(guild_id=rng.choice(guild_ids), guild_name="guild", user_id=user_id, user_name="user")
+                for user_id in rng.sample(user_ids, ADMINS)
+            ]
+        )
+
+        AutoRole.objects.bulk_create(
+            [
+                AutoRole(guild_id=guild_id, guild_name="guild", role_id=guild_id + 1, role_name="role")
+                for guild_id in guild_ids
+            ]
+        )
+
+        WelcomeChannels.objects.bulk_create(
+            [
+                WelcomeChannels(
+                    guild_id=guild_id,
+                    guild_name="guild",
+                    channel_id=guild_id + 2,
+                    channel_name="welcome",
+                    title="Welcome <username>",
+                    description="",
+                    colour="#ffffff",
+                    show_pfp=0
+                )
+                for guild_id in guild_ids
+            ]
+        )
+
+        # Fresh tables have no statistics, the planner needs them to see the volumes
+        with connection.cursor() as cursor:
+            for model in (Guilds, GuildConfig, Blacklist, Birthdays, Admins, AutoRole, WelcomeChannels):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+        cls.guild_id = guild_ids[GUILDS // 2]
+        cls.user_id = user_ids[BLACKLISTED // 2]
+
+    def assertIndexScan(self, queryset: QuerySet, index: str = None) -> None:
+        plan = queryset.explain()
+
+        self.assertNotIn("Seq Scan", plan, plan)
+        self.assertTrue(any(scan in plan for scan in INDEX_SCANS), plan)
+
+        if index:
+            self.assertIn(index, plan, plan)
+
+    def test_blacklist_by_user(self) -> None:
+        # not_blacklisted() on every command
+        self.assertIndexScan(Blacklist.objects.filter(user_id=self.user_id)[:1], "blacklist_user_idx")
+
+    def test_birthdays_by_user(self) -> None:
+        self.assertIndexScan(Birthdays.objects.filter(user_id=self.user_id), "birthdays_user_idx")
+
+    def test_birthdays_by_date(self) -> None:
+        # The birthday_check task, served by the (day, month, user_id) unique index
+        self.assertIndexScan(Birthdays.objects.filter(month=6, day=15))
+
+    def test_admins_by_guild_and_user(self) -> None:
+        self.assertIndexScan(
+            Admins.objects.filter(guild_id=self.guild_id, user_id=self.user_id),
+            "admins_guild_user_idx"
+        )
+
+    def test_guild_config_by_guild(self) -> None:
+        self.assertIndexScan(GuildConfig.objects.filter(guild_id=self.guild_id))
+
+    def test_auto_role_by_guild(self) -> None:
+        self.assertIndexScan(AutoRole.objects.filter(guild_id=self.guild_id).order_by('pk')[:1])
+
+    def test_welcome_channels_by_guild(self) -> None:
+        self.assertIndexScan(WelcomeChannels.objects.filter(guild_id=self.guild_id).order_by('pk')[:1])
@@ -0,0 +1,166 @@
+import asyncio
+
+from unittest import IsolatedAsyncioTestCase
+
+from ..managers.joins import JoinQueue
+
+WINDOW = 0.01
+
+
+class FakeRole:
+    id = 7
+    name = "Member"
+
+
+class FakePermissions:
+    manage_roles = True
+
+
+class FakeMe:
+    guild_permissions = FakePermissions()
+
+
+class FakeGuild:
+    id = 1
+    name = "Guild"
+    me = FakeMe()
+    preferred_locale = None
+
+    def __init__(self) -> None:
+        self.members: dict[int, "FakeMember"] = {}
+
+    def get_member(self, member_id: int) -> "FakeMember":
+        return self.members.get(member_id)
+
+    def get_role(self, role_id: int) -> FakeRole:
+        return FakeRole()
+
+
+class FakeMember:
+    def __init__(self, guild: FakeGuild, member_id: int) -> None:
+        self.guild = guild
+        self.id = member_id
+        self.display_name = f"member {member_id}"
+        self.mention = f"<@{member_id}>"
+        self.roles = []
+        self.avatar = None
+        self.default_avatar = type("Asset", (), {"url": "avatar"})()
+        self.role_adds = 0
+
+    async def add_roles(self, role: FakeRole) -> None:
+        self.role_adds += 1
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def send(self, **kwargs) -> None:
+        self.sent += 1
+
+
+class FakeTemplate:
+    colour = None
+
+    def render(self, user: FakeMember, avatar_url: str) -> object:
+        return object()
+
+
+class FakeWelcome:
+    active = True
+    channel_id = 5
+    template = FakeTemplate()
+
+
+class FakeAutoRole:
+    active = True
+    role_id = FakeRole.id
+
+
+class FakeSettings:
+    welcome = FakeWelcome()
+    auto_role = FakeAutoRole()
+
+
+class FakeGuildSettings:
+    async def get(self, guild_id: int) -> FakeSettings:
+        return FakeSettings()
+
+
+class FakeResolver:
+    async def resolve(self, key, cached, fetch):
+        return cached()
+
+
+class FakeDBManager:
+    def __init__(self) -> None:
+        self.batches: list[list[FakeMember]] = []
+
+    async def sync_member(self, member: FakeMember) -> None:
+        self.batches.append([member])
+
+    async def sync_members(self, guild: FakeGuild, members: list[FakeMember]) -> None:
+        self.batches.append(list(members))
+
+
+class FakeClient:
+    def __init__(self, channel: FakeChannel) -> None:
+        self.channel = channel
+        self.db_manager = FakeDBManager()
+        self.guild_settings = FakeGuildSettings()
+        self.resolver = FakeResolver()
+
+    def get_channel(self, channel_id: int) -> FakeChannel:
+        return self.channel
+
+
+class JoinQueueTests(IsolatedAsyncioTestCase):
+    async def _wait_for_workers(self, queue: JoinQueue) -> None:
+        while queue._workers or queue._role_workers:
+            await asyncio.sleep(WINDOW)
+
+    async def test_rejoin_inside_window_is_processed_once(self) -> None:
+        channel = FakeChannel()
+        client = FakeClient(channel)
+        queue = JoinQueue(client, window=WINDOW, threshold=5, role_interval=0)
+        guild = FakeGuild()
+
+        first = FakeMember(guild, 1)
+        other = FakeMember(guild, 2)
+        rejoined = FakeMember(guild, 1)
+
+        # Joins, leaves and rejoins before the batch runs
+        for member in (first, other, rejoined):
+            guild.members[member.id] = member
+            queue.push(member)
+
+        await self._wait_for_workers(queue)
+
+        self.assertEqual(len(client.db_manager.batches), 1)
+
+        batch = client.db_manager.batches[0]
+
+        self.assertEqual([member.id for member in batch], [1, 2])
+        self.assertIs(batch[0], rejoined)
+        self.assertEqual(channel.sent, 2)
+        self.assertEqual(first.role_adds + rejoined.role_adds, 1)
+        self.assertEqual(rejoined.role_adds, 1)
+
+    async def test_members_who_left_are_dropped(self) -> None:
+        channel = FakeChannel()
+        client = FakeClient(channel)
+        queue = JoinQueue(client, window=WINDOW, threshold=5, role_interval=0)
+        guild = FakeGuild()
+
+        stays = FakeMember(guild, 1)
+        leaves = FakeMember(guild, 2)
+        guild.members[stays.id] = stays
+
+        queue.push(stays)
+        queue.push(leaves)
+
+        await self._wait_for_workers(queue)
+
+        self.assertEqual(client.db_manager.batches, [[stays]])
+        self.assertEqual(channel.sent, 1)
+        self.assertEqual(leaves.role_adds, 0)
@@ -0,0 +1,182 @@
+import math
+import random
+import asyncio
+
+from unittest import TestCase, IsolatedAsyncioTestCase
+
+from ..managers.spam import SpamTracker, SpamCleaner
+
+GUILD_ID = 1
+
+# A raid: 50 authors sending 40 messages each over 4 seconds in 3 channels
+RAIDERS = 50
+MESSAGES_PER_RAIDER = 40
+RAID_DURATION = 4.0
+CHANNELS = 3
+
+# The guild's spam window and limit
+TIME_WINDOW = 5
+MAX_PER_WINDOW = 2
+
+
+class FakeChannel:
+    """
+    A channel that counts the REST calls made through it
+    """
+
+    def __init__(self, channel_id: int) -> None:
+        self.id = channel_id
+        self.deleted: list[int] = []
+        self.delete_calls = 0
+        self.send_calls = 0
+
+    async def delete_messages(self, messages: list["FakeMessage"], reason: str = None) -> None:
+        self.delete_calls += 1
+        self.deleted.append(len(messages))
+
+    async def send(self, content: str) -> None:
+        self.send_calls += 1
+
+
+class FakeMessage:
+    def __init__(self, channel: FakeChannel) -> None:
+        self.channel = channel
+        self.delete_calls = 0
+
+    async def delete(self) -> None:
+        self.delete_calls += 1
+
+
+def simulate_raid(seed: int = 1) -> list[tuple[float, int, int]]:
+    """
+    Returns the raid's (timestamp, author, channel index) in the order they were sent
+    """
+
+    rng = random.Random(seed)
+
+    return sorted(
+        (rng.uniform(0, RAID_DURATION), author, rng.randrange(CHANNELS))
+        for author in range(RAIDERS)
+        for _ in range(MESSAGES_PER_RAIDER)
+    )
+
+
+class SpamTrackerTests(TestCase):
+    def test_flags_author_over_limit(self) -> None:
+        tracker = SpamTracker(TIME_WINDOW, MAX_PER_WINDOW)
+
+        self.assertFalse(tracker.hit(GUILD_ID, 1, now=0.0))
+        self.assertFalse(tracker.hit(GUILD_ID, 1, now=1.0))
+        self.assertTrue(tracker.hit(GUILD_ID, 1, now=2.0))
+
+        # The first two fell out of the window
+        self.assertFalse(tracker.hit(GUILD_ID, 1, now=7.5))
+
+    def test_guild_thresholds_override_defaults(self) -> None:
+        tracker = SpamTracker(TIME_WINDOW, MAX_PER_WINDOW)
+
+        for i in range(5):
+            self.assertFalse(tracker.hit(GUILD_ID, 1, time_window=1, max_per_window=5, now=i * 0.1))
+
+        self.assertTrue(tracker.hit(GUILD_ID, 1, time_window=1, max_per_window=5, now=0.5))
+
+    def test_sweep_drops_idle_authors(self) -> None:
+        tracker = SpamTracker(TIME_WINDOW, MAX_PER_WINDOW)
+
+        tracker.hit(GUILD_ID, 1, now=0.0)
+        tracker.hit(GUILD_ID, 2, now=4.0)
+
+        self.assertEqual(tracker.sweep(now=6.0), 1)
+        self.assertEqual(len(tracker), 1)
+
+
+class SpamCleanerTests(IsolatedAsyncioTestCase):
+    FLUSH_INTERVAL = 0.01
+
+    async def _wait_for_flushes(self) -> None:
+        await asyncio.sleep(self.FLUSH_INTERVAL * 5)
+
+    async def test_once_per_author_per_window(self) -> None:
+        cleaner = SpamCleaner(self.FLUSH_INTERVAL)
+
+        self.assertTrue(cleaner.once("notice", GUILD_ID, 1, TIME_WINDOW, now=0.0))
+        self.assertFalse(cleaner.once("notice", GUILD_ID, 1, TIME_WINDOW, now=4.9))
+        self.assertTrue(cleaner.once("notice", GUILD_ID, 2, TIME_WINDOW, now=4.9))
+        self.assertTrue(cleaner.once("kick", GUILD_ID, 1, TIME_WINDOW, now=4.9))
+        self.assertTrue(cleaner.once("notice", GUILD_ID, 1, TIME_WINDOW, now=5.0))
+
+    async def test_flush_deletes_in_chunks_of_100(self) -> None:
+        cleaner = SpamCleaner(self.FLUSH_INTERVAL)
+        channel = FakeChannel(1)
+
+        for _ in range(250):
+            cleaner.queue(FakeMessage(channel))
+
+        await self._wait_for_flushes()
+
+        self.assertEqual(channel.deleted, [100, 100, 50])
+
+    async def test_messages_after_a_flush_start_a_new_batch(self) -> None:
+        cleaner = SpamCleaner(self.FLUSH_INTERVAL)
+        channel = FakeChannel(1)
+
+        cleaner.queue(FakeMessage(channel))
+        await self._wait_for_flushes()
+        cleaner.queue(FakeMessage(channel))
+        await self._wait_for_flushes()
+
+        self.assertEqual(channel.deleted, [1, 1])
+
+    async def test_raid_rest_calls(self) -> None:
+        """
+        Counts the REST calls of the same raid handled per message and through the cleaner
+        """
+
+        raid = simulate_raid()
+
+        # Before: every flagged message was deleted and answered with a notice on its own
+        tracker = SpamTracker(TIME_WINDOW, MAX_PER_WINDOW)
+        channels = [FakeChannel(i) for i in range(CHANNELS)]
+        messages: list[FakeMessage] = []
+
+        for timestamp, author, channel_index in raid:
+            message = FakeMessage(channels[channel_index])
+
+            if tracker.hit(GUILD_ID, author, now=timestamp):
+                await message.delete()
+                await message.channel.send("notice")
+                messages.append(message)
+
+        flagged = len(messages)
+        before = sum(message.delete_calls for message in messages) + sum(channel.send_calls for channel in channels)
+
+        self.assertEqual(before, flagged * 2)
+
+        # After: deletions queued per channel, the notice sent once per author per window
+        tracker = SpamTracker(TIME_WINDOW, MAX_PER_WINDOW)
+        cleaner = SpamCleaner(self.FLUSH_INTERVAL)
+        channels = [FakeChannel(i) for i in range(CHANNELS)]
+        per_channel = [0] * CHANNELS
+
+        for timestamp, author, channel_index in raid:
+            message = FakeMessage(channels[channel_index])
+
+            if tracker.hit(GUILD_ID, author, now=timestamp):
+                cleaner.queue(message)
+                per_channel[channel_index] += 1
+
+                if cleaner.once("notice", GUILD_ID, author, TIME_WINDOW, now=timestamp):
+                    await message.channel.send("notice")
+
+        await self._wait_for_flushes()
+
+        delete_calls = sum(channel.delete_calls for channel in channels)
+        send_calls = sum(channel.send_calls for channel in channels)
+
+        self.assertEqual(sum(per_channel), flagged)
+        self.assertEqual(sum(sum(channel.deleted) for channel in channels), flagged)
+        self.assertEqual(delete_calls, sum(math.ceil(count / SpamCleaner.MAX_BULK) for count in per_channel))
+
+        # The raid is shorter than the window, so each raider gets exactly one notice
+        self.assertEqual(send_calls, RAIDERS)
+        self.assertLess(delete_calls + send_calls, before / 20)
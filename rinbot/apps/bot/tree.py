@@ -7,7 +7,7 @@ from discord.app_commands import MissingPermissions, BotMissingPermissions, Comm
 from discord.app_commands.errors import AppCommandError, TransformerError
 from typing import Optional, TYPE_CHECKING
 
-from .managers.locale import get_interaction_locale, get_localised_string
+from .managers.locale import get_locale_context
 from .log import Logger, log_exception
 from .responder import respond
 from .errors import RinBotError
@@ -21,21 +21,28 @@ if TYPE_CHECKING:
 logger = Logger.TREE
 
 
+async def interaction_check(interaction: Interaction) -> bool:
+    # Resolve the interaction's locale once on dispatch, everything after reads it from interaction.extras
+    get_locale_context(interaction)
+    
+    return True
+
+
 async def on_error(interaction: Interaction, error: AppCommandError) -> None:
-    locale = get_interaction_locale(interaction)
+    locale = get_locale_context(interaction)
     
     if isinstance(error, MissingPermissions):
         key = "tree_missing_perms"
         perms = ", ".join(error.missing_permissions)
         
-        string = get_localised_string(locale, key, perms=perms) if perms else get_localised_string(locale, key)
+        string = locale.t(key, perms=perms) if perms else locale.t(key)
         await respond(interaction, Colour.red(), string, hidden=True)
 
     elif isinstance(error, BotMissingPermissions):
         key = "tree_bot_missing_perms"
         perms = ", ".join(error.missing_permissions)
         
-        string = get_localised_string(locale, key, perms=perms) if perms else get_localised_string(locale, key)
+        string = locale.t(key, perms=perms) if perms else locale.t(key)
         await respond(interaction, Colour.red(), string, hidden=True)
     
     elif isinstance(error, TransformerError):
@@ -45,7 +52,7 @@ async def on_error(interaction: Interaction, error: AppCommandError) -> None:
             f"Transformer failure: [Converting: {error.value} | To: {error.transformer._error_display_name!s}]"
         )
         
-        string = get_localised_string(locale, key)
+        string = locale.t(key)
         await respond(interaction, Colour.red(), string, hidden=True)
     
     elif isinstance(error, RinBotError):
@@ -2,7 +2,7 @@ from discord import Interaction, Embed, Colour, SelectOption
 from discord.ui import View, Select
 from typing import Dict, List
 
-from ..managers.locale import get_interaction_locale, get_localised_string
+from ..managers.locale import get_locale_context, LocaleContext
 from ..errors import InteractionTimedOut
 
 
@@ -11,7 +11,7 @@ class BirthdayRemove(View):
         super().__init__(timeout=60.0)
         
         self.original_interaction = original_interaction
-        locale = get_interaction_locale(self.original_interaction)
+        locale = get_locale_context(self.original_interaction)
         
         self.selected_names: List[str] = []
         self.has_options = False
@@ -36,11 +36,11 @@ class BirthdayRemove(View):
 
 
 class BirthdaySelect(Select):
-    def __init__(self, options: List[SelectOption], locale: str) -> None:
+    def __init__(self, options: List[SelectOption], locale: LocaleContext) -> None:
         self.locale = locale
         
         super().__init__(
-            placeholder=get_localised_string(self.locale, "ui_birthday_remove_placeholder"),
+            placeholder=self.locale.t("ui_birthday_remove_placeholder"),
             min_values=1,
             max_values=len(options),
             options=options
@@ -56,7 +56,7 @@ class BirthdaySelect(Select):
             
             await interaction.edit_original_response(
                 embed=Embed(
-                    description=get_localised_string(self.locale, "ui_birthday_remove_selected", names=names_str),
+                    description=self.locale.t("ui_birthday_remove_selected", names=names_str),
                     colour=Colour.green()
                 ), 
                 view=None
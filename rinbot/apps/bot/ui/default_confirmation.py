@@ -2,7 +2,7 @@ from discord import Interaction, Embed, Colour, ButtonStyle
 from discord.ui import View, Button, button as btn
 from typing import Optional
 
-from ..managers.locale import get_interaction_locale, get_localised_string
+from ..managers.locale import get_locale_context
 
 
 class DefaultConfirmation(View):
@@ -18,16 +18,16 @@ class DefaultConfirmation(View):
         self.confirm_embed = confirm_embed
         self.cancel_embed = cancel_embed
         
-        locale = get_interaction_locale(interaction)
+        locale = get_locale_context(interaction)
         
         if not cancel_embed:
             self.cancel_embed = Embed(
-                description=get_localised_string(locale, "ui_generic_cancel_embed_desc"),
+                description=locale.t("ui_generic_cancel_embed_desc"),
                 colour=Colour.red()
             )
         
-        self._confirm.label = get_localised_string(locale, "ui_button_yes")
-        self._cancel.label = get_localised_string(locale, "ui_button_no")
+        self._confirm.label = locale.t("ui_button_yes")
+        self._cancel.label = locale.t("ui_button_no")
     
     async def on_timeout(self):
         self.stop()
@@ -1,33 +1,33 @@
 from discord import Interaction, Embed, Colour, ButtonStyle
 from discord.ui import View, Button, button as btn
 
-from ..managers.locale import get_interaction_locale, get_localised_string
+from ..managers.locale import get_locale_context
 
 
 class GreetingConfirmation(View):
     def __init__(self, original_interaction: Interaction) -> None:
         super().__init__(timeout=60)
 
-        locale = get_interaction_locale(original_interaction)
+        locale = get_locale_context(original_interaction)
 
         self.original_interaction = original_interaction
         self.response = False
 
         self.confirm_embed = Embed(
-            description=get_localised_string(
-                locale, "ui_set_greeting_aproved",
+            description=locale.t(
+                "ui_set_greeting_aproved",
             ),
             colour=Colour.green()
         )
         self.cancel_embed = Embed(
-            description=get_localised_string(
-                locale, "ui_set_greeting_reproved",
+            description=locale.t(
+                "ui_set_greeting_reproved",
             ),
             colour=Colour.gold()
         )
 
-        self._confirm.label = get_localised_string(locale, "ui_set_greeting_confirm_label")
-        self._cancel.label = get_localised_string(locale, "ui_set_greeting_cancel_label")
+        self._confirm.label = locale.t("ui_set_greeting_confirm_label")
+        self._cancel.label = locale.t("ui_set_greeting_cancel_label")
 
     async def on_timeout(self) -> None:
         self.stop()
@@ -1,7 +1,7 @@
 from discord import Interaction, Embed, Colour, ButtonStyle
 from discord.ui import View, Button, button
 
-from ..managers.locale import get_interaction_locale, get_localised_string
+from ..managers.locale import get_locale_context
 
 
 class WelcomeConfirmation(View):
@@ -9,19 +9,19 @@ class WelcomeConfirmation(View):
         super().__init__(timeout=60)
         
         self.response: bool = None
-        locale = get_interaction_locale(original_interaction)
+        locale = get_locale_context(original_interaction)
         
         self.confirm_embed = Embed(
-            description=get_localised_string(locale, "ui_wc_aproved"),
+            description=locale.t("ui_wc_aproved"),
             colour=Colour.green()
         )
         self.deny_embed = Embed(
-            description=get_localised_string(locale, "ui_wc_denied"),
+            description=locale.t("ui_wc_denied"),
             colour=Colour.yellow()
         )
         
-        self._confirm.label = get_localised_string(locale, "ui_wc_confirm_label")
-        self._cancel.label = get_localised_string(locale, "ui_wc_cancel_label")
+        self._confirm.label = locale.t("ui_wc_confirm_label")
+        self._cancel.label = locale.t("ui_wc_cancel_label")
     
     async def on_timeout(self) -> None:
         self.response = False
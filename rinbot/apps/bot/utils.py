@@ -2,9 +2,8 @@ from discord import (
     Interaction,
     Guild,
     Member,
-    User,
-    Forbidden,
-    NotFound
+    Role,
+    User
 )
 
 from discord import ForumChannel, TextChannel, CategoryChannel
@@ -15,10 +14,7 @@ from typing import Optional, Union, TYPE_CHECKING
 from logging import Logger as LoggingLogger
 from functools import wraps
 
-from .managers.locale import (
-    get_interaction_locale,
-    get_localised_string
-)
+from .managers.locale import get_locale_context
 
 from .log import log_exception
 
@@ -27,62 +23,55 @@ if TYPE_CHECKING:
 
 
 def get_full_command(interaction: Interaction) -> str:
-    locale = get_interaction_locale(interaction)
+    locale = get_locale_context(interaction)
     
     command = interaction.command
-    command_name= get_localised_string(locale, command.name)
+    command_name= locale.t(command.name)
     
     if isinstance(command, Command):
         if command.parent:
-            command_group = get_localised_string(locale, command.parent.name)
+            command_group = locale.t(command.parent.name)
             command_name = f"/{command_group} {command_name}"
     
     return command_name
 
 
 async def get_guild(client: "Client", guild_id: int) -> Optional[Guild]:
-    try:
-        guild = client.get_guild(guild_id)
-
-        if not guild:
-            guild = await client.fetch_guild(guild_id)
-        
-        return guild if guild else None
-    
-    except (Forbidden, NotFound):
-        return None
+    return await client.resolver.resolve(
+        ("guild", guild_id),
+        lambda: client.get_guild(guild_id),
+        lambda: client.fetch_guild(guild_id)
+    )
 
 
 async def get_member(client: "Client", guild: Guild | int, member_id: int) -> Optional[Member]:
-    try:
-        if isinstance(guild, int):
-            guild = await get_guild(client, guild)
-            
-            if not guild:
-                return None
-        
-        member = guild.get_member(member_id)
-        
-        if not member:
-            member = await guild.fetch_member(member_id)
+    if isinstance(guild, int):
+        guild = await get_guild(client, guild)
         
-        return member if member else None
+        if not guild:
+            return None
     
-    except (Forbidden, NotFound):
-        return None
+    return await client.resolver.resolve(
+        ("member", guild.id, member_id),
+        lambda: guild.get_member(member_id),
+        lambda: guild.fetch_member(member_id)
+    )
+
+
+async def get_role(client: "Client", guild: Guild, role_id: int) -> Optional[Role]:
+    return await client.resolver.resolve(
+        ("role", guild.id, role_id),
+        lambda: guild.get_role(role_id),
+        lambda: guild.fetch_role(role_id)
+    )
 
 
 async def get_user(client: "Client", user_id: int) -> Optional[User]:
-    try:
-        user = client.get_user(user_id)
-        
-        if not user:
-            user = await client.fetch_user(user_id)
-        
-        return user if user else None
-    
-    except (Forbidden, NotFound):
-        return None
+    return await client.resolver.resolve(
+        ("user", user_id),
+        lambda: client.get_user(user_id),
+        lambda: client.fetch_user(user_id)
+    )
 
 
 async def get_user_avatar(user: User | Member, as_bytes: bool = False) -> str | bytes:
@@ -96,16 +85,11 @@ async def get_channel(
         client: "Client",
         channel_id: int
 ) -> Optional[Thread | PrivateChannel | Union[ForumChannel, TextChannel, CategoryChannel]]:
-    try:
-        channel = client.get_channel(channel_id)
-        
-        if not channel:
-            channel = await client.fetch_channel(channel_id)
-        
-        return channel if channel else None
-    
-    except (Forbidden, NotFound):
-        return None
+    return await client.resolver.resolve(
+        ("channel", channel_id),
+        lambda: client.get_channel(channel_id),
+        lambda: client.fetch_channel(channel_id)
+    )
 
 
 def log_errors(logger: LoggingLogger, is_async: bool = False):